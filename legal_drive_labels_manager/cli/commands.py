@@ -2,6 +2,7 @@
 
 import argparse
 import csv
+import importlib.util
 import sys
 import time
 import os
@@ -696,11 +697,12 @@ def cmd_report(args: argparse.Namespace) -> int:
         
         # Check for visualization libraries if using HTML format
         if format_type == "html":
-            try:
-                import pandas
-                import matplotlib
-                import seaborn
-            except ImportError:
+            # Only locate the packages here; the report imports them itself
+            # once it has something to chart
+            if not all(
+                importlib.util.find_spec(name) is not None
+                for name in ("pandas", "matplotlib", "seaborn")
+            ):
                 print(TextFormatter.format_error(
                     "Visualization libraries not found. Install with:\n"
                     "pip install legal-drive-labels-manager[visualization]"
@@ -153,7 +153,11 @@ Type 'help <command>' for detailed information about a command.
         """Exit on Ctrl+D."""
         print()  # Add newline
         return self.do_exit(arg)
-    
+
+    def postloop(self) -> None:
+        """Close the audit logs when the shell exits."""
+        self.file_manager.close()
+
     def do_auth(self, arg: str) -> bool:
         """
         Authenticate with Google APIs or manage authentication.
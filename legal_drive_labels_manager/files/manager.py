@@ -1,16 +1,20 @@
 """Primary interface for managing Google Drive file labels."""
 
 import logging
-import re
 import time
 from typing import Dict, List, Optional, Any, Tuple, Union, Callable
 
 from googleapiclient.errors import HttpError
 
 from legal_drive_labels_manager.auth.credentials import AuthManager
+from legal_drive_labels_manager.utils.config import get_config
 from legal_drive_labels_manager.utils.logging import AuditLogger
 from legal_drive_labels_manager.labels.manager import LabelManager
 from legal_drive_labels_manager.labels.fields import FieldType, FieldValue
+from legal_drive_labels_manager.files.operations import extract_file_id_from_url
+
+# Maximum number of calls the Drive API accepts in one batch HTTP request
+_MAX_BATCH_REQUESTS = 100
 
 
 class FileManager:
@@ -46,6 +50,11 @@ class FileManager:
         self._labels_service = None
         self._app_logger = logging.getLogger(__name__)
 
+    def close(self) -> None:
+        """Close the audit logs held by this manager and its label manager."""
+        self.logger.close()
+        self.label_manager.close()
+
     @property
     def drive_service(self) -> Any:
         """Get the Drive API service."""
@@ -70,27 +79,8 @@ class FileManager:
         Returns:
             Extracted file ID
         """
-        # If it looks like a simple ID, return it
-        if re.match(r'^[a-zA-Z0-9_-]+$', file_id_or_url):
-            return file_id_or_url
-            
-        # Try to extract from URL patterns
-        patterns = [
-            r'/file/d/([a-zA-Z0-9_-]+)',  # Drive file link
-            r'/document/d/([a-zA-Z0-9_-]+)',  # Docs
-            r'/spreadsheets/d/([a-zA-Z0-9_-]+)',  # Sheets
-            r'/presentation/d/([a-zA-Z0-9_-]+)',  # Slides
-            r'/folder/([a-zA-Z0-9_-]+)',  # Folder
-            r'id=([a-zA-Z0-9_-]+)'  # Old style or direct ID parameter
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, file_id_or_url)
-            if match:
-                return match.group(1)
-        
         # If we couldn't extract an ID, assume the input is already an ID
-        return file_id_or_url
+        return extract_file_id_from_url(file_id_or_url) or file_id_or_url
 
     def get_file_metadata(
         self, 
@@ -561,7 +551,8 @@ class FileManager:
                 - "label_id": Label ID
                 - Additional parameters based on operation type
             progress_callback: Optional callback for progress updates
-            batch_size: Optional batch size override (default: from config)
+            batch_size: Optional number of requests per batch HTTP request
+                (default: from config, capped at 100)
                 
         Returns:
             Dictionary with operation results
@@ -574,6 +565,9 @@ class FileManager:
             config = get_config()
             batch_size = config.get_api_config().get("batch_size", 50)
         
+        # A single batch HTTP request may carry at most 100 calls
+        batch_size = max(1, min(batch_size, _MAX_BATCH_REQUESTS))
+        
         # Initialize results
         results = {
             "total": len(operations),
@@ -583,6 +577,40 @@ class FileManager:
             "errors": []
         }
         
+        def record(file_id, label_id, ops, operation=None, error=None):
+            # Record the outcome of every operation covered by one request
+            for op in ops:
+                result = {
+                    "operation": operation or op.get("operation"),
+                    "file_id": file_id,
+                    "label_id": label_id,
+                    "success": error is None
+                }
+                if error is None:
+                    results["successful"] += 1
+                else:
+                    results["failed"] += 1
+                    results["errors"].append(error)
+                    result["error"] = error
+                results["results"].append(result)
+        
+        # Field types per label, fetched once per label rather than per operation
+        label_field_types = {}
+        
+        def field_types_for(label_id):
+            if label_id not in label_field_types:
+                try:
+                    label = self.label_manager.get_label(label_id)
+                    label_field_types[label_id] = {
+                        f.get("id"): f.get("type") for f in label.get("fields", [])
+                    }
+                except Exception as e:
+                    self._app_logger.warning(
+                        f"Error getting field types for label {label_id}: {e}"
+                    )
+                    label_field_types[label_id] = None
+            return label_field_types[label_id]
+        
         # Group operations by file_id to minimize API calls
         file_groups = {}
         for op in operations:
@@ -596,206 +624,141 @@ class FileManager:
                 
             file_groups[file_id].append(op)
         
-        # Track progress
-        processed_count = 0
-        total_groups = len(file_groups)
-        group_count = 0
-        
-        # Process file groups in batches
-        file_ids = list(file_groups.keys())
-        for batch_start in range(0, len(file_ids), batch_size):
-            batch_end = min(batch_start + batch_size, len(file_ids))
-            batch_file_ids = file_ids[batch_start:batch_end]
-            
-            # Process each file in this batch
-            for file_id in batch_file_ids:
-                group_count += 1
-                file_ops = file_groups[file_id]
+        # Build one modifyLabels request per file and label; each entry is
+        # (request, file_id, label_id, operations, operation name)
+        pending = []
+        pending_removals = []
+        for file_id, file_ops in file_groups.items():
+            # Group operations by label_id
+            label_operations = {}
+            for op in file_ops:
+                label_id = op.get("label_id")
+                if not label_id:
+                    continue
                 
-                # Update progress with group information
-                if progress_callback:
-                    progress_callback(
-                        processed_count, 
-                        len(operations),
-                        f"Processing file {group_count}/{total_groups}"
-                    )
+                if label_id not in label_operations:
+                    label_operations[label_id] = {
+                        "apply": [],
+                        "remove": []
+                    }
                 
-                try:
-                    # Organize operations by label_id
-                    label_operations = {}
-                    
-                    # Group operations by label_id
-                    for op in file_ops:
-                        label_id = op.get("label_id")
-                        if not label_id:
-                            continue
-                        
-                        if label_id not in label_operations:
-                            label_operations[label_id] = {
-                                "apply": [],
-                                "remove": []
-                            }
+                # Categorize operation
+                if op.get("operation") == "remove":
+                    label_operations[label_id]["remove"].append(op)
+                else:
+                    label_operations[label_id]["apply"].append(op)
+            
+            for label_id, label_ops in label_operations.items():
+                # 'apply' operations (includes update/unset)
+                if label_ops["apply"]:
+                    try:
+                        # Collect field modifications for this label
+                        field_modifications = []
                         
-                        # Categorize operation
-                        op_type = op.get("operation")
-                        if op_type == "remove":
-                            label_operations[label_id]["remove"].append(op)
-                        else:
-                            label_operations[label_id]["apply"].append(op)
-                    
-                    # Process label operations
-                    for label_id, label_ops in label_operations.items():
-                        # Process 'apply' operations first (includes update/unset)
-                        if label_ops["apply"]:
-                            try:
-                                # Collect field modifications for this label
-                                field_modifications = []
-                                
-                                for op in label_ops["apply"]:
-                                    op_type = op.get("operation")
-                                    field_id = op.get("field_id")
-                                    
-                                    if not field_id:
-                                        continue
-                                    
-                                    # Handle different operation types
-                                    if op_type == "apply" or op_type == "update":
-                                        value = op.get("value")
-                                        
-                                        if value is not None:
-                                            # Get label for field type info
-                                            try:
-                                                label = self.label_manager.get_label(label_id)
-                                                
-                                                # Find field type
-                                                field_type = None
-                                                for f in label.get("fields", []):
-                                                    if f.get("id") == field_id:
-                                                        field_type = f.get("type")
-                                                        break
-                                                
-                                                # Create appropriate field modification
-                                                if field_type:
-                                                    field_modification = self._create_field_modification(
-                                                        field_id, field_type, value
-                                                    )
-                                                    field_modifications.append(field_modification)
-                                            except Exception as e:
-                                                self._app_logger.warning(
-                                                    f"Error getting field type for {field_id}: {e}"
-                                                )
-                                                # Default to text if label info not available
-                                                field_modifications.append({
-                                                    "fieldId": field_id,
-                                                    "setTextValues": [str(value)]
-                                                })
-                                    elif op_type == "unset":
-                                        field_modifications.append({
-                                            "fieldId": field_id,
-                                            "unsetValues": True
-                                        })
-                                
-                                # If we have field modifications, apply them
-                                if field_modifications:
-                                    label_modification = {
-                                        "labelId": label_id,
-                                        "fieldModifications": field_modifications
-                                    }
-                                    
-                                    self.drive_service.files().modifyLabels(
-                                        fileId=file_id,
-                                        body={
-                                            "labelModifications": [label_modification]
-                                        }
-                                    ).execute()
-                                    
-                                    # Mark operations as successful
-                                    for op in label_ops["apply"]:
-                                        results["successful"] += 1
-                                        results["results"].append({
-                                            "operation": op.get("operation"),
-                                            "file_id": file_id,
-                                            "label_id": label_id,
-                                            "success": True
-                                        })
-                                        processed_count += 1
+                        for op in label_ops["apply"]:
+                            op_type = op.get("operation")
+                            field_id = op.get("field_id")
+                            
+                            if not field_id:
+                                continue
+                            
+                            # Handle different operation types
+                            if op_type == "apply" or op_type == "update":
+                                value = op.get("value")
+                                if value is None:
+                                    continue
                                 
-                            except Exception as e:
-                                # Mark all apply operations for this label as failed
-                                error = str(e)
-                                for op in label_ops["apply"]:
-                                    results["failed"] += 1
-                                    results["errors"].append(error)
-                                    results["results"].append({
-                                        "operation": op.get("operation"),
-                                        "file_id": file_id,
-                                        "label_id": label_id,
-                                        "success": False,
-                                        "error": error
+                                field_types = field_types_for(label_id)
+                                if field_types is None:
+                                    # Default to text if label info not available
+                                    field_modifications.append({
+                                        "fieldId": field_id,
+                                        "setTextValues": [str(value)]
                                     })
-                                    processed_count += 1
+                                elif field_types.get(field_id):
+                                    field_modifications.append(
+                                        self._create_field_modification(
+                                            field_id, field_types[field_id], value
+                                        )
+                                    )
+                            elif op_type == "unset":
+                                field_modifications.append({
+                                    "fieldId": field_id,
+                                    "unsetValues": True
+                                })
                         
-                        # Now process 'remove' operations
-                        if label_ops["remove"]:
-                            try:
-                                # Remove the label
-                                self.drive_service.files().modifyLabels(
-                                    fileId=file_id,
-                                    body={
-                                        "labelModifications": [{
-                                            "labelId": label_id,
-                                            "removeLabel": True
-                                        }]
-                                    }
-                                ).execute()
-                                
-                                # Mark remove operations as successful
-                                for op in label_ops["remove"]:
-                                    results["successful"] += 1
-                                    results["results"].append({
-                                        "operation": "remove",
-                                        "file_id": file_id,
-                                        "label_id": label_id,
-                                        "success": True
-                                    })
-                                    processed_count += 1
-                                    
-                            except Exception as e:
-                                # Mark all remove operations for this label as failed
-                                error = str(e)
-                                for op in label_ops["remove"]:
-                                    results["failed"] += 1
-                                    results["errors"].append(error)
-                                    results["results"].append({
-                                        "operation": "remove",
-                                        "file_id": file_id,
-                                        "label_id": label_id,
-                                        "success": False,
-                                        "error": error
-                                    })
-                                    processed_count += 1
-                
-                except Exception as e:
-                    # File-level error - mark all operations for this file as failed
-                    error = str(e)
-                    for op in file_ops:
-                        results["failed"] += 1
-                        results["errors"].append(error)
-                        results["results"].append({
-                            "operation": op.get("operation"),
-                            "file_id": file_id,
-                            "label_id": op.get("label_id"),
-                            "success": False,
-                            "error": error
-                        })
-                        processed_count += 1
+                        if field_modifications:
+                            request = self.drive_service.files().modifyLabels(
+                                fileId=file_id,
+                                body={
+                                    "labelModifications": [{
+                                        "labelId": label_id,
+                                        "fieldModifications": field_modifications
+                                    }]
+                                }
+                            )
+                            pending.append((request, file_id, label_id, label_ops["apply"], None))
+                    except Exception as e:
+                        record(file_id, label_id, label_ops["apply"], error=str(e))
                 
-                # Update progress
-                if progress_callback:
-                    progress_callback(processed_count, len(operations))
+                # 'remove' operations
+                if label_ops["remove"]:
+                    try:
+                        request = self.drive_service.files().modifyLabels(
+                            fileId=file_id,
+                            body={
+                                "labelModifications": [{
+                                    "labelId": label_id,
+                                    "removeLabel": True
+                                }]
+                            }
+                        )
+                        pending_removals.append((request, file_id, label_id, label_ops["remove"], "remove"))
+                    except Exception as e:
+                        record(file_id, label_id, label_ops["remove"], "remove", str(e))
+        
+        # Send the requests as batch HTTP requests instead of one round trip
+        # each. Requests within a batch may run in any order, so removals go
+        # in batches of their own after every apply, as they ran before
+        batches = [
+            requests[batch_start:batch_start + batch_size]
+            for requests in (pending, pending_removals)
+            for batch_start in range(0, len(requests), batch_size)
+        ]
+        batch_count = len(batches)
+        for batch_number, batch_entries in enumerate(batches, 1):
+            if progress_callback:
+                progress_callback(
+                    results["successful"] + results["failed"],
+                    len(operations),
+                    f"Processing batch {batch_number}/{batch_count}"
+                )
+            
+            answered = set()
+            
+            def on_response(request_id, response, exception):
+                answered.add(request_id)
+                _, file_id, label_id, ops, operation = batch_entries[int(request_id)]
+                record(file_id, label_id, ops, operation, str(exception) if exception else None)
+            
+            batch = self.drive_service.new_batch_http_request(callback=on_response)
+            for index, entry in enumerate(batch_entries):
+                batch.add(entry[0], request_id=str(index))
+            
+            try:
+                batch.execute()
+            except Exception as e:
+                # The batch itself failed; fail every request it didn't answer
+                for index, (_, file_id, label_id, ops, operation) in enumerate(batch_entries):
+                    if str(index) not in answered:
+                        record(file_id, label_id, ops, operation, str(e))
+            
+            # Update progress
+            if progress_callback:
+                progress_callback(results["successful"] + results["failed"], len(operations))
             
             # Pause between batches to avoid rate limiting
-            if batch_end < len(file_ids):
+            if batch_number < batch_count:
                 time.sleep(1.0)
         
         # Final progress update
@@ -811,50 +774,49 @@ class FileManager:
         
         return results
 
+    def _create_field_modification(self, field_id: str, field_type: str, value: Any) -> Dict[str, Any]:
+        """
+        Create a field modification based on field type.
 
-def _create_field_modification(self, field_id: str, field_type: str, value: Any) -> Dict[str, Any]:
-    """
-    Create a field modification based on field type.
-    
-    Args:
-        field_id: Field ID to modify
-        field_type: Type of the field
-        value: Value to set
-        
-    Returns:
-        Field modification dictionary
-    """
-    if field_type == "SELECTION":
-        return {
-            "fieldId": field_id,
-            "setSelectionValues": [{"valueId": str(value)}]
-        }
-    elif field_type == "TEXT" or field_type == "LONG_TEXT":
-        return {
-            "fieldId": field_id,
-            "setTextValues": [str(value)]
-        }
-    elif field_type == "INTEGER":
-        return {
-            "fieldId": field_id,
-            "setIntegerValues": [int(value)]
-        }
-    elif field_type == "DATE":
-        return {
-            "fieldId": field_id,
-            "setDateValues": [str(value)]
-        }
-    elif field_type == "USER":
-        return {
-            "fieldId": field_id,
-            "setUserValues": [str(value)]
-        }
-    else:
-        # Default to text for unknown types
-        return {
-            "fieldId": field_id,
-            "setTextValues": [str(value)]
-        }
+        Args:
+            field_id: Field ID to modify
+            field_type: Type of the field
+            value: Value to set
+
+        Returns:
+            Field modification dictionary
+        """
+        if field_type == "SELECTION":
+            return {
+                "fieldId": field_id,
+                "setSelectionValues": [{"valueId": str(value)}]
+            }
+        elif field_type == "TEXT" or field_type == "LONG_TEXT":
+            return {
+                "fieldId": field_id,
+                "setTextValues": [str(value)]
+            }
+        elif field_type == "INTEGER":
+            return {
+                "fieldId": field_id,
+                "setIntegerValues": [int(value)]
+            }
+        elif field_type == "DATE":
+            return {
+                "fieldId": field_id,
+                "setDateValues": [str(value)]
+            }
+        elif field_type == "USER":
+            return {
+                "fieldId": field_id,
+                "setUserValues": [str(value)]
+            }
+        else:
+            # Default to text for unknown types
+            return {
+                "fieldId": field_id,
+                "setTextValues": [str(value)]
+            }
 
     def bulk_apply_labels(
         self, 
@@ -7,13 +7,26 @@ import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Any, Callable, Tuple, Union
 
 from googleapiclient.errors import HttpError
 
 from legal_drive_labels_manager.utils.logging import AuditLogger
 from legal_drive_labels_manager.labels.fields import create_search_query_for_labels
 
+# Something that already looks like a bare file ID
+_SIMPLE_FILE_ID = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# URL patterns that carry a file ID, tried in order
+_FILE_ID_URL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'/file/d/([a-zA-Z0-9_-]+)',  # Drive file link
+    r'/document/d/([a-zA-Z0-9_-]+)',  # Docs
+    r'/spreadsheets/d/([a-zA-Z0-9_-]+)',  # Sheets
+    r'/presentation/d/([a-zA-Z0-9_-]+)',  # Slides
+    r'/folder/([a-zA-Z0-9_-]+)',  # Folder
+    r'id=([a-zA-Z0-9_-]+)'  # Old style or direct ID parameter
+))
+
 
 def extract_file_id_from_url(url: str) -> Optional[str]:
     """
@@ -26,52 +39,39 @@ def extract_file_id_from_url(url: str) -> Optional[str]:
         File ID or None if not found
     """
     # If it looks like a simple ID, return it
-    if re.match(r'^[a-zA-Z0-9_-]+$', url):
+    if _SIMPLE_FILE_ID.match(url):
         return url
         
     # Try to extract from URL patterns
-    patterns = [
-        r'/file/d/([a-zA-Z0-9_-]+)',  # Drive file link
-        r'/document/d/([a-zA-Z0-9_-]+)',  # Docs
-        r'/spreadsheets/d/([a-zA-Z0-9_-]+)',  # Sheets
-        r'/presentation/d/([a-zA-Z0-9_-]+)',  # Slides
-        r'/folder/([a-zA-Z0-9_-]+)',  # Folder
-        r'id=([a-zA-Z0-9_-]+)'  # Old style or direct ID parameter
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _FILE_ID_URL_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
     return None
 
 
-def parse_csv_for_bulk_operations(
+def iter_csv_for_bulk_operations(
     file_path: Union[str, Path], 
     required_columns: Optional[List[str]] = None,
     validate_ids: bool = True
-) -> Tuple[List[Dict[str, str]], List[str]]:
+) -> Iterator[Tuple[str, Any]]:
     """
-    Parse a CSV file for bulk operations.
+    Stream a CSV file for bulk operations one row at a time.
     
     Args:
         file_path: Path to CSV file
         required_columns: List of required column names
         validate_ids: Whether to validate and extract file IDs from URLs
         
-    Returns:
-        Tuple containing:
-        - List of row dictionaries
-        - List of error messages
+    Yields:
+        ("row", row_dict) for each valid row and ("error", message) for
+        each problem found, in file order
     """
     logger = logging.getLogger(__name__)
     
     if required_columns is None:
         required_columns = ["fileId", "labelId", "fieldId", "value"]
-        
-    rows = []
-    errors = []
     
     try:
         with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
@@ -92,18 +92,19 @@ def parse_csv_for_bulk_operations(
             if not reader.fieldnames:
                 error_msg = "CSV file has no headers"
                 logger.error(error_msg)
-                errors.append(error_msg)
-                return rows, errors
+                yield "error", error_msg
+                return
                 
             missing_columns = [col for col in required_columns if col not in reader.fieldnames]
             
             if missing_columns:
                 error_msg = f"CSV is missing required columns: {', '.join(missing_columns)}"
                 logger.error(error_msg)
-                errors.append(error_msg)
-                return rows, errors
+                yield "error", error_msg
+                return
             
             # Process rows
+            found_rows = False
             for i, row in enumerate(reader, start=2):  # Start at line 2 (after header)
                 # Skip completely empty rows
                 if not any(row.values()):
@@ -113,8 +114,7 @@ def parse_csv_for_bulk_operations(
                 missing_values = [col for col in required_columns if not row.get(col)]
                 
                 if missing_values:
-                    error_msg = f"Row {i}: Missing values for: {', '.join(missing_values)}"
-                    errors.append(error_msg)
+                    yield "error", f"Row {i}: Missing values for: {', '.join(missing_values)}"
                     continue
                 
                 # Process file IDs if needed
@@ -123,27 +123,53 @@ def parse_csv_for_bulk_operations(
                     if file_id:
                         row["fileId"] = file_id
                     else:
-                        error_msg = f"Row {i}: Invalid file ID or URL: {row['fileId']}"
-                        errors.append(error_msg)
+                        yield "error", f"Row {i}: Invalid file ID or URL: {row['fileId']}"
                         continue
                 
-                rows.append(row)
+                found_rows = True
+                yield "row", row
                 
-        if not rows:
-            errors.append("No valid data rows found in CSV file")
-            
-        return rows, errors
+            if not found_rows:
+                yield "error", "No valid data rows found in CSV file"
         
     except FileNotFoundError:
         error_msg = f"CSV file not found: {file_path}"
         logger.error(error_msg)
-        errors.append(error_msg)
-        return rows, errors
+        yield "error", error_msg
     except Exception as e:
         error_msg = f"Error reading CSV file: {str(e)}"
         logger.error(error_msg)
-        errors.append(error_msg)
-        return rows, errors
+        yield "error", error_msg
+
+
+def parse_csv_for_bulk_operations(
+    file_path: Union[str, Path], 
+    required_columns: Optional[List[str]] = None,
+    validate_ids: bool = True
+) -> Tuple[List[Dict[str, str]], List[str]]:
+    """
+    Parse a CSV file for bulk operations.
+    
+    Args:
+        file_path: Path to CSV file
+        required_columns: List of required column names
+        validate_ids: Whether to validate and extract file IDs from URLs
+        
+    Returns:
+        Tuple containing:
+        - List of row dictionaries
+        - List of error messages
+    """
+    rows = []
+    errors = []
+    
+    for kind, item in iter_csv_for_bulk_operations(file_path, required_columns, validate_ids):
+        if kind == "row":
+            rows.append(item)
+        else:
+            errors.append(item)
+    
+    return rows, errors
 
 
 def process_batch_operation(
@@ -29,6 +29,11 @@ class FieldType(Enum):
         Raises:
             ValueError: If value is not a valid field type
         """
+        try:
+            return _FIELD_TYPES_BY_VALUE[value]
+        except (KeyError, TypeError):
+            pass
+        
         try:
             return cls(value)
         except ValueError:
@@ -62,6 +67,65 @@ class FieldType(Enum):
         return operators_map.get(field_type, [])
 
 
+# Field types keyed by their string value, for from_string lookups
+_FIELD_TYPES_BY_VALUE = {field_type.value: field_type for field_type in FieldType}
+
+
+def _format_text_value(value: Any) -> Dict[str, Any]:
+    """Format a TEXT or LONG_TEXT value for API requests."""
+    return {"textValue": str(value)}
+
+
+def _format_integer_value(value: Any) -> Dict[str, Any]:
+    """Format an INTEGER value for API requests."""
+    try:
+        int_value = int(value)
+        return {"integerValue": int_value}
+    except ValueError:
+        raise ValueError(f"Invalid integer value: {value}")
+
+
+def _format_date_value(value: Any) -> Dict[str, Any]:
+    """Format a DATE value for API requests."""
+    # Basic ISO format validation
+    if not isinstance(value, str):
+        value = str(value)
+        
+    # Very basic date format validation
+    if len(value) < 8:  # Minimum YYYY-MM-DD
+        raise ValueError(f"Invalid date format: {value}. Use ISO format (YYYY-MM-DD).")
+        
+    return {"dateValue": value}
+
+
+def _format_user_value(value: Any) -> Dict[str, Any]:
+    """Format a USER value for API requests."""
+    # Handle both email strings and user objects
+    if isinstance(value, dict) and "emailAddress" in value:
+        return {"userValue": value}
+    return {"userValue": str(value)}
+
+
+def _format_selection_value(value: Any) -> Dict[str, Any]:
+    """Format a SELECTION value for API requests."""
+    # For SELECTION, the value should be the option ID, not display name
+    if isinstance(value, dict) and "valueId" in value:
+        return {"selectionValue": value}
+    # Handle both ID and display name cases
+    return {"selectionValue": {"valueId": str(value)}}
+
+
+# Value formatters keyed by field type, for format_value lookups
+_VALUE_FORMATTERS = {
+    FieldType.TEXT: _format_text_value,
+    FieldType.LONG_TEXT: _format_text_value,
+    FieldType.INTEGER: _format_integer_value,
+    FieldType.DATE: _format_date_value,
+    FieldType.USER: _format_user_value,
+    FieldType.SELECTION: _format_selection_value,
+}
+
+
 class FieldValue:
     """Helper class for working with field values of different types."""
     
@@ -85,39 +149,12 @@ class FieldValue:
         if isinstance(field_type, str):
             field_type = FieldType.from_string(field_type)
             
-        if field_type == FieldType.TEXT or field_type == FieldType.LONG_TEXT:
-            return {"textValue": str(value)}
-        elif field_type == FieldType.INTEGER:
-            try:
-                int_value = int(value)
-                return {"integerValue": int_value}
-            except ValueError:
-                raise ValueError(f"Invalid integer value: {value}")
-        elif field_type == FieldType.DATE:
-            # Basic ISO format validation
-            if not isinstance(value, str):
-                value = str(value)
-                
-            # Very basic date format validation
-            if len(value) < 8:  # Minimum YYYY-MM-DD
-                raise ValueError(f"Invalid date format: {value}. Use ISO format (YYYY-MM-DD).")
-                
-            return {"dateValue": value}
-        elif field_type == FieldType.USER:
-            # Handle both email strings and user objects
-            if isinstance(value, dict) and "emailAddress" in value:
-                return {"userValue": value}
-            else:
-                return {"userValue": str(value)}
-        elif field_type == FieldType.SELECTION:
-            # For SELECTION, the value should be the option ID, not display name
-            if isinstance(value, dict) and "valueId" in value:
-                return {"selectionValue": value}
-            else:
-                # Handle both ID and display name cases
-                return {"selectionValue": {"valueId": str(value)}}
-        else:
+        try:
+            formatter = _VALUE_FORMATTERS[field_type]
+        except (KeyError, TypeError):
             raise ValueError(f"Unsupported field type: {field_type}")
+            
+        return formatter(value)
     
     @staticmethod
     def parse_value(field_type: Union[str, FieldType], value_dict: Dict[str, Any]) -> Any:
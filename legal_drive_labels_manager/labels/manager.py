@@ -38,6 +38,10 @@ class LabelManager:
         self._labels_service = None
         self._app_logger = logging.getLogger(__name__)
 
+    def close(self) -> None:
+        """Close the audit log held by this manager."""
+        self.logger.close()
+
     @property
     def drive_service(self) -> Any:
         """Get the Drive API service."""
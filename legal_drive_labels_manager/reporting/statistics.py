@@ -4,6 +4,7 @@ import csv
 import datetime
 import logging
 import os
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Union
 
@@ -83,7 +84,18 @@ class LabelStatistics:
             # Query for each label's usage
             for label in labels:
                 label_id = label["id"]
-                label_title = label["title"]
+                label_fields = label.get("fields", [])
+                
+                # Summary fields are the same whether or not the count succeeds
+                base = {
+                    "id": label_id,
+                    "title": label["title"],
+                    "state": label["state"],
+                    "fields": len(label_fields),
+                    "required_fields": sum(1 for f in label_fields if f.get("required", False)),
+                    "label_type": label.get("labelType", "ADMIN"),
+                    "has_unpublished_changes": label.get("hasUnpublishedChanges", False)
+                }
                 
                 # Use Drive API search to find files with this label
                 # This is more efficient than checking each file individually
@@ -111,31 +123,12 @@ class LabelStatistics:
                             break
                     
                     # Add to usage stats
-                    usage_stats.append({
-                        "id": label_id,
-                        "title": label_title,
-                        "state": label["state"],
-                        "file_count": file_count,
-                        "fields": len(label.get("fields", [])),
-                        "required_fields": sum(1 for f in label.get("fields", []) if f.get("required", False)),
-                        "label_type": label.get("labelType", "ADMIN"),
-                        "has_unpublished_changes": label.get("hasUnpublishedChanges", False)
-                    })
+                    usage_stats.append({**base, "file_count": file_count})
                     
                 except Exception as e:
                     self.logger.error(f"Error counting files for label {label_id}: {e}")
                     # In case of error, add with count 0
-                    usage_stats.append({
-                        "id": label_id,
-                        "title": label_title,
-                        "state": label["state"],
-                        "file_count": 0,
-                        "fields": len(label.get("fields", [])),
-                        "required_fields": sum(1 for f in label.get("fields", []) if f.get("required", False)),
-                        "label_type": label.get("labelType", "ADMIN"),
-                        "has_unpublished_changes": label.get("hasUnpublishedChanges", False),
-                        "error": str(e)
-                    })
+                    usage_stats.append({**base, "file_count": 0, "error": str(e)})
             
             # Sort by usage count (highest first)
             usage_stats.sort(key=lambda x: x["file_count"], reverse=True)
@@ -260,7 +253,6 @@ class LabelStatistics:
             users_list = [{"user": k, "count": v} for k, v in users.items()]
             users_list.sort(key=lambda x: x["count"], reverse=True)
             
-            action_types_list = [{"type": k, "count": v} for k, v in action_types.items()]
             action_types_list = [{"type": k, "count": v} for k, v in action_types.items()]
             action_types_list.sort(key=lambda x: x["count"], reverse=True)
             
@@ -563,8 +555,16 @@ class LabelStatistics:
                 if not page_token:
                     break
             
-            # Initialize field value stats
-            field_stats = {}
+            # Index label fields once so name/type resolution is a dict lookup
+            fields_by_id = {field["id"]: field for field in label.get("fields", [])}
+            
+            # Initialize field value stats; entries are created on first access
+            field_stats = defaultdict(lambda: {
+                "values": Counter(),
+                "count": 0,
+                "name": None,
+                "type": None
+            })
             
             # Analyze field values across files
             for file in files:
@@ -576,22 +576,17 @@ class LabelStatistics:
                     fields = label_data.get("fields", {})
                     
                     for field_id, field_value in fields.items():
-                        # Initialize field stats if not exists
-                        if field_id not in field_stats:
-                            field_stats[field_id] = {
-                                "values": {},
-                                "count": 0
-                            }
-                            
-                            # Add field name from label details
-                            for field in label["fields"]:
-                                if field["id"] == field_id:
-                                    field_stats[field_id]["name"] = field["name"]
-                                    field_stats[field_id]["type"] = field["type"]
-                                    break
+                        stats = field_stats[field_id]
+                        
+                        # Resolve field name and type from label details on first write
+                        if stats["name"] is None:
+                            field = fields_by_id.get(field_id)
+                            if field is not None:
+                                stats["name"] = field["name"]
+                                stats["type"] = field["type"]
                             else:
-                                field_stats[field_id]["name"] = field_id
-                                field_stats[field_id]["type"] = "UNKNOWN"
+                                stats["name"] = field_id
+                                stats["type"] = "UNKNOWN"
                         
                         # Extract value based on field type
                         value = None
@@ -611,13 +606,8 @@ class LabelStatistics:
                             value = "Unknown"
                         
                         # Count value occurrences
-                        value_str = str(value)
-                        if value_str in field_stats[field_id]["values"]:
-                            field_stats[field_id]["values"][value_str] += 1
-                        else:
-                            field_stats[field_id]["values"][value_str] = 1
-                            
-                        field_stats[field_id]["count"] += 1
+                        stats["values"][str(value)] += 1
+                        stats["count"] += 1
             
             # Process field stats into result format
             result_fields = []
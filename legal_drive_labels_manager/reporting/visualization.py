@@ -1,427 +1,474 @@
 """Visualization tools for Drive Labels reporting."""
 
+import html
+import importlib.util
+import io
 import os
 import tempfile
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 
 from legal_drive_labels_manager.reporting.statistics import LabelStatistics
 
+# pybase64 provides a SIMD base64 encoder with the same API; fall back to
+# the standard library when it isn't installed.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
-class ReportGenerator:
-    """Generate visual reports for Drive Labels usage.
+# Select the non-interactive backend before matplotlib is ever imported so
+# pyplot never probes for a GUI backend, and give it a writable cache dir
+# to avoid rebuilding the font cache on headless hosts.
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ.setdefault("MPLCONFIGDIR", os.path.join(tempfile.gettempdir(), "mpl-cache"))
+
+# Charts are embedded in the HTML report, so favour fast PNG encoding over
+# the last few percent of file size.
+_PNG_SAVE_OPTIONS = {"compress_level": 1}
+_PNG_PALETTE_COLORS = 64
+
+# Row layouts of the plain text report tables, filled from the statistics
+# dictionaries with str.format_map
+_LABEL_ROW_FORMAT = "{title:<40} {state:<15} {file_count:<10} {fields:<10}"
+_ACTION_ROW_FORMAT = "{type:<40} {count:<10}"
+_USER_ROW_FORMAT = "{user:<50} {count:<10}"
+
+# Static recommendations section of the plain text report
+_TEXT_REPORT_RECOMMENDATIONS = (
+    "-" * 40,
+    "RECOMMENDATIONS",
+    "-" * 40,
+    "1. Regularly review unused labels to maintain a clean environment.",
+    "2. Consider standardizing label naming conventions for better organization.",
+    "3. Provide training to users on proper label application.",
+    "4. Review required fields to ensure they add value without creating barriers.",
+    "5. Set up regular reporting to monitor label usage trends.",
+    "",
+)
+
+# Long activity series (e.g. a year of days) produce line paths with hundreds
+# of vertices; let Agg drop sub-pixel detail and draw them in chunks.
+_LINE_RENDER_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# Reports with embedded charts run to several megabytes; write them through a
+# buffer large enough to take the whole page in one go.
+_REPORT_WRITE_BUFFER = 8 * 1024 * 1024
+
+
+def _new_figure(width: float, height: float) -> Tuple[Any, Any]:
+    """
+    Create a standalone figure with an Agg canvas and a single axes.
     
-    This class provides tools for generating comprehensive reports on
-    label usage across your Google Drive environment.
+    The figure is not registered with pyplot, so it needs no explicit
+    close and is released as soon as it goes out of scope.
     
-    Attributes:
-        statistics: LabelStatistics instance for gathering data
-        _has_visualization_libs: Whether visualization libraries are available
+    Args:
+        width: Figure width in inches
+        height: Figure height in inches
+        
+    Returns:
+        Tuple of (figure, axes)
     """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=(width, height))
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
 
-    def __init__(self, statistics: Optional[LabelStatistics] = None) -> None:
-        """
-        Initialize the report generator.
+
+def _figure_to_data_uri(fig: Any, dpi: int) -> str:
+    """
+    Render a figure to PNG in memory and encode it as a data URI.
+    
+    Args:
+        fig: Figure to render
+        dpi: Output resolution
         
-        Args:
-            statistics: Optional LabelStatistics instance
-        """
-        self.statistics = statistics or LabelStatistics()
-        self._has_visualization_libs = self._check_visualization_libraries()
-        self.logger = logging.getLogger(__name__)
+    Returns:
+        PNG image as a base64 ``data:`` URI
+    """
+    buf = io.BytesIO()
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    
+    if Image is not None:
+        # Charts use a handful of flat colours, so an 8-bit palette PNG is
+        # visually identical to truecolour RGBA and a fraction of the size
+        import numpy as np
+        
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert("RGB")
+        # Pillow < 9.1 has the method constants on Image itself
+        median_cut = getattr(Image, "Quantize", Image).MEDIANCUT
+        image = image.quantize(colors=_PNG_PALETTE_COLORS, method=median_cut)
+        image.save(buf, format="PNG", **_PNG_SAVE_OPTIONS)
+    else:
+        fig.savefig(buf, format="png", dpi=dpi, pil_kwargs=_PNG_SAVE_OPTIONS)
+    encoded = _b64.b64encode(buf.getbuffer()).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
 
-    def _check_visualization_libraries(self) -> bool:
-        """
-        Check if visualization libraries are available.
+
+@lru_cache(maxsize=32)
+def _palette(cmap_name: str, start: float, stop: float, count: int) -> Any:
+    """
+    Sample evenly spaced colours from a matplotlib colormap.
+    
+    Palettes are cached and shared between charts, so the returned array is
+    read-only.
+    
+    Args:
+        cmap_name: Name of the colormap, e.g. ``"Blues_r"``
+        start: Colormap position of the first colour, in [0, 1]
+        stop: Colormap position of the last colour, in [0, 1]
+        count: Number of colours
         
-        Returns:
-            True if visualization libraries are available, False otherwise
-        """
-        try:
-            import matplotlib
-            import pandas
-            import seaborn
-            return True
-        except ImportError:
-            return False
+    Returns:
+        Array of RGBA colours with one row per colour
+    """
+    import numpy as np
+    from matplotlib import cm
+    
+    colors = getattr(cm, cmap_name)(np.linspace(start, stop, count))
+    colors.setflags(write=False)
+    return colors
 
-    def _ensure_visualization_libraries(self) -> bool:
-        """
-        Ensure visualization libraries are available or provide installation instructions.
+
+def _render_top_labels(top_df: Any, dpi: int) -> str:
+    """
+    Render the bar chart of the most used labels.
+    
+    Args:
+        top_df: DataFrame of the top labels, ordered by file count
+        dpi: Output resolution
         
-        Returns:
-            True if libraries are available, False otherwise
-        """
-        if not self._has_visualization_libs:
-            self.logger.warning("Visualization libraries are not installed.")
-            print("Visualization libraries are not installed.")
-            print("To install required packages:")
-            print("pip install pandas matplotlib seaborn")
-            return False
-        return True
+    Returns:
+        PNG image as a base64 data URI
+    """
+    import numpy as np
+    
+    fig, ax = _new_figure(12, 7)
+    
+    # Create bar chart with improved styling
+    positions = np.arange(len(top_df))
+    ax.bar(
+        positions,
+        top_df['file_count'].to_numpy(),
+        color=_palette('Blues_r', 0.2, 0.8, len(top_df))
+    )
+    ax.set_xticks(positions)
+    ax.set_xticklabels(top_df['title'].to_numpy())
+    ax.xaxis.grid(False)
+    ax.set_title('Top Labels by Usage', fontsize=16, pad=20)
+    ax.set_xlabel('Label', fontsize=14)
+    ax.set_ylabel('Number of Files', fontsize=14)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=12)
+    ax.tick_params(axis='y', labelsize=12)
+    for tick_label in ax.get_xticklabels():
+        tick_label.set_horizontalalignment('right')
+    
+    # Add count labels on top of each bar
+    ax.bar_label(ax.containers[0], fmt='%d', padding=3, fontsize=11)
+    
+    fig.tight_layout()
+    return _figure_to_data_uri(fig, dpi)
 
-    def generate_usage_report(
-        self, 
-        output_path: Union[str, Path],
-        lookback_days: int = 30,
-        top_n_labels: int = 10,
-        include_disabled: bool = True
-    ) -> bool:
-        """
-        Generate a comprehensive HTML report on label usage.
+
+def _render_states(state_counts: Any, dpi: int) -> str:
+    """
+    Render the pie chart of label states.
+    
+    Args:
+        state_counts: Series of label counts indexed by state
+        dpi: Output resolution
         
-        Args:
-            output_path: Path to save the HTML report
-            lookback_days: Number of days to include in activity analysis
-            top_n_labels: Number of top labels to highlight
-            include_disabled: Whether to include disabled labels in statistics
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        if not self._ensure_visualization_libraries():
-            return False
-            
-        try:
-            import pandas as pd
-            import matplotlib.pyplot as plt
-            import matplotlib
-            import seaborn as sns
-            
-            # Set non-interactive backend
-            matplotlib.use('Agg')
-            
-            # Set seaborn style
-            sns.set_style("whitegrid")
-            
-            # Get label usage statistics
-            usage_stats = self.statistics.count_labels_by_usage()
-            
-            # Convert to DataFrame for easier manipulation
-            df = pd.DataFrame(usage_stats)
-            
-            # Filter out disabled labels if requested
-            if not include_disabled:
-                df = df[df['state'] != 'DISABLED']
-            
-            # Create a temporary directory for figures
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Generate figures
-                fig_paths = {}
-                
-                # 1. Bar chart of top labels by usage with improved styling
-                top_labels_fig = os.path.join(temp_dir, 'top_labels.png')
-                plt.figure(figsize=(12, 7))
-                
-                # Use top N labels or all if less than N
-                top_n = min(top_n_labels, len(df))
-                top_df = df.sort_values('file_count', ascending=False).head(top_n)
-                
-                # Create bar chart with improved styling
-                sns.barplot(x='title', y='file_count', data=top_df, palette='Blues_d')
-                plt.title('Top Labels by Usage', fontsize=16, pad=20)
-                plt.xlabel('Label', fontsize=14)
-                plt.ylabel('Number of Files', fontsize=14)
-                plt.xticks(rotation=45, ha='right', fontsize=12)
-                plt.yticks(fontsize=12)
-                
-                # Add count labels on top of each bar
-                for i, row in enumerate(top_df.itertuples()):
-                    plt.text(i, row.file_count + (max(top_df.file_count) * 0.02), 
-                             str(row.file_count),
-                             ha='center', va='bottom', fontsize=11)
-                
-                plt.tight_layout()
-                plt.savefig(top_labels_fig, dpi=300)
-                plt.close()
-                
-                fig_paths['top_labels'] = top_labels_fig
-                
-                # 2. Pie chart of label states with improved styling
-                if len(df) > 0:  # Only create if there are labels
-                    state_counts = df['state'].value_counts()
-                    if len(state_counts) > 0:  # Only create if there are states
-                        states_fig = os.path.join(temp_dir, 'label_states.png')
-                        
-                        plt.figure(figsize=(10, 10))
-                        colors = sns.color_palette('Blues', len(state_counts))
-                        explode = [0.1 if state == 'PUBLISHED' else 0 for state in state_counts.index]
-                        
-                        # Create pie chart
-                        patches, texts, autotexts = plt.pie(
-                            state_counts, 
-                            labels=state_counts.index, 
-                            autopct='%1.1f%%', 
-                            startangle=90,
-                            explode=explode,
-                            colors=colors,
-                            shadow=True
-                        )
-                        
-                        # Enhance text appearance
-                        for text in texts:
-                            text.set_fontsize(14)
-                        for autotext in autotexts:
-                            autotext.set_fontsize(12)
-                            autotext.set_color('white')
-                            
-                        plt.axis('equal')
-                        plt.title('Label States Distribution', fontsize=16, pad=20)
-                        plt.savefig(states_fig, dpi=300)
-                        plt.close()
-                        
-                        fig_paths['states'] = states_fig
-                
-                # 3. Required vs Optional Fields chart
-                if len(df) > 0:  # Only create if there are labels
-                    fields_fig = os.path.join(temp_dir, 'fields_required.png')
-                    
-                    # Calculate total fields and required fields
-                    total_fields = df['fields'].sum()
-                    required_fields = df['required_fields'].sum()
-                    optional_fields = total_fields - required_fields
-                    
-                    if total_fields > 0:  # Only create if there are fields
-                        plt.figure(figsize=(10, 8))
-                        
-                        # Create grouped bar chart
-                        field_data = pd.DataFrame({
-                            'Category': ['Required Fields', 'Optional Fields'],
-                            'Count': [required_fields, optional_fields]
-                        })
-                        
-                        sns.barplot(x='Category', y='Count', data=field_data, palette=['#1f77b4', '#aec7e8'])
-                        plt.title('Required vs Optional Fields', fontsize=16, pad=20)
-                        plt.xlabel('Field Type', fontsize=14)
-                        plt.ylabel('Count', fontsize=14)
-                        plt.xticks(fontsize=12)
-                        plt.yticks(fontsize=12)
-                        
-                        # Add count labels on top of each bar
-                        for i, count in enumerate(field_data['Count']):
-                            plt.text(i, count + (max(field_data['Count']) * 0.02), 
-                                    str(count),
-                                    ha='center', va='bottom', fontsize=12)
-                        
-                        # Add percentage labels
-                        total = required_fields + optional_fields
-                        if total > 0:
-                            req_pct = required_fields / total * 100
-                            opt_pct = optional_fields / total * 100
-                            
-                            plt.text(0, required_fields / 2, f"{req_pct:.1f}%", 
-                                    ha='center', va='center', fontsize=12, color='white', fontweight='bold')
-                            plt.text(1, optional_fields / 2, f"{opt_pct:.1f}%", 
-                                    ha='center', va='center', fontsize=12, color='white', fontweight='bold')
-                        
-                        plt.tight_layout()
-                        plt.savefig(fields_fig, dpi=300)
-                        plt.close()
-                        
-                        fig_paths['fields'] = fields_fig
-                
-                # Get audit log data
-                audit_data = self.statistics.analyze_audit_log(days=lookback_days)
-                
-                # 4. Daily activity chart with improved styling
-                if audit_data.get('daily_activity'):
-                    daily_df = pd.DataFrame(audit_data['daily_activity'])
-                    
-                    if len(daily_df) > 0:  # Only create if there's activity data
-                        daily_df['date'] = pd.to_datetime(daily_df['date'])
-                        daily_df = daily_df.sort_values('date')
-                        
-                        # Fill in missing dates with zero counts
-                        if len(daily_df) > 0:
-                            date_range = pd.date_range(
-                                start=daily_df['date'].min(),
-                                end=daily_df['date'].max()
-                            )
-                            filled_df = daily_df.set_index('date').reindex(date_range, fill_value=0)
-                            filled_df = filled_df.reset_index().rename(columns={'index': 'date'})
-                            
-                            activity_fig = os.path.join(temp_dir, 'daily_activity.png')
-                            plt.figure(figsize=(14, 7))
-                            
-                            # Plot line chart with area fill
-                            sns.lineplot(x='date', y='count', data=filled_df, marker='o', linewidth=2, color='#1f77b4')
-                            plt.fill_between(filled_df['date'], filled_df['count'], alpha=0.3, color='#1f77b4')
-                            
-                            plt.title('Daily Label Activity', fontsize=16, pad=20)
-                            plt.xlabel('Date', fontsize=14)
-                            plt.ylabel('Number of Actions', fontsize=14)
-                            plt.xticks(rotation=45, fontsize=12)
-                            plt.yticks(fontsize=12)
-                            plt.grid(True, linestyle='--', alpha=0.7)
-                            
-                            # Add rolling average
-                            if len(filled_df) >= 3:  # Only add rolling average if enough data
-                                filled_df['rolling_avg'] = filled_df['count'].rolling(window=3, min_periods=1).mean()
-                                sns.lineplot(x='date', y='rolling_avg', data=filled_df, 
-                                            linestyle='--', linewidth=1.5, color='#ff7f0e', 
-                                            label='3-Day Rolling Average')
-                                plt.legend(fontsize=12)
-                            
-                            plt.tight_layout()
-                            plt.savefig(activity_fig, dpi=300)
-                            plt.close()
-                            
-                            fig_paths['activity'] = activity_fig
-                
-                # 5. Action types chart with improved styling
-                if audit_data.get('action_types'):
-                    action_df = pd.DataFrame(audit_data['action_types'])
-                    
-                    if len(action_df) > 0:  # Only create if there's action data
-                        actions_fig = os.path.join(temp_dir, 'action_types.png')
-                        plt.figure(figsize=(12, 8))
-                        
-                        # Sort by count descending
-                        action_df = action_df.sort_values('count', ascending=False)
-                        
-                        # Create horizontal bar chart
-                        bar_colors = sns.color_palette('Blues_r', len(action_df))
-                        bars = plt.barh(action_df['type'], action_df['count'], color=bar_colors)
-                        
-                        plt.title('Actions by Type', fontsize=16, pad=20)
-                        plt.xlabel('Count', fontsize=14)
-                        plt.ylabel('Action Type', fontsize=14)
-                        plt.yticks(fontsize=12)
-                        plt.xticks(fontsize=12)
-                        
-                        # Add count labels
-                        for bar in bars:
-                            width = bar.get_width()
-                            plt.text(width + (max(action_df['count']) * 0.02), 
-                                    bar.get_y() + bar.get_height()/2, 
-                                    str(int(width)),
-                                    va='center', fontsize=12)
-                        
-                        plt.tight_layout()
-                        plt.savefig(actions_fig, dpi=300)
-                        plt.close()
-                        
-                        fig_paths['actions'] = actions_fig
-                
-                # 6. Users activity chart
-                if audit_data.get('users'):
-                    users_df = pd.DataFrame(audit_data['users'])
-                    
-                    if len(users_df) > 0:  # Only create if there's user data
-                        # Only take top 10 users
-                        top_users = min(10, len(users_df))
-                        users_df = users_df.sort_values('count', ascending=False).head(top_users)
-                        
-                        # Create user activity chart
-                        users_fig = os.path.join(temp_dir, 'user_activity.png')
-                        plt.figure(figsize=(12, 8))
-                        
-                        # Create horizontal bar chart
-                        user_colors = sns.color_palette('Blues_r', len(users_df))
-                        bars = plt.barh(users_df['user'], users_df['count'], color=user_colors)
-                        
-                        plt.title('Top Users by Activity', fontsize=16, pad=20)
-                        plt.xlabel('Number of Actions', fontsize=14)
-                        plt.ylabel('User', fontsize=14)
-                        plt.yticks(fontsize=12)
-                        plt.xticks(fontsize=12)
-                        
-                        # Add count labels
-                        for bar in bars:
-                            width = bar.get_width()
-                            plt.text(width + (max(users_df['count']) * 0.02), 
-                                    bar.get_y() + bar.get_height()/2, 
-                                    str(int(width)),
-                                    va='center', fontsize=12)
-                        
-                        plt.tight_layout()
-                        plt.savefig(users_fig, dpi=300)
-                        plt.close()
-                        
-                        fig_paths['users'] = users_fig
-                
-                # Generate HTML report
-                html_content = self._generate_html_report(
-                    usage_stats, 
-                    audit_data, 
-                    fig_paths,
-                    lookback_days=lookback_days
-                )
-                
-                # Write HTML to file
-                with open(output_path, 'w') as f:
-                    f.write(html_content)
-            
-            self.logger.info(f"HTML report generated successfully: {output_path}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error generating report: {e}")
-            print(f"Error generating report: {e}")
-            return False
+    Returns:
+        PNG image as a base64 data URI
+    """
+    fig, ax = _new_figure(10, 10)
+    colors = _palette('Blues', 0.0, 1.0, len(state_counts) + 2)[1:-1]
+    explode = [0.1 if state == 'PUBLISHED' else 0 for state in state_counts.index]
+    
+    # Create pie chart
+    patches, texts, autotexts = ax.pie(
+        state_counts, 
+        labels=state_counts.index, 
+        autopct='%1.1f%%', 
+        startangle=90,
+        explode=explode,
+        colors=colors,
+        shadow=True
+    )
+    
+    # Enhance text appearance
+    for text in texts:
+        text.set_fontsize(14)
+    for autotext in autotexts:
+        autotext.set_fontsize(12)
+        autotext.set_color('white')
+        
+    ax.axis('equal')
+    ax.set_title('Label States Distribution', fontsize=16, pad=20)
+    return _figure_to_data_uri(fig, dpi)
 
-    def _generate_html_report(
-        self, 
-        usage_stats: List[Dict[str, Any]], 
-        audit_data: Dict[str, Any],
-        figure_paths: Dict[str, str],
-        lookback_days: int = 30
-    ) -> str:
-        """
-        Generate HTML content for the report.
+
+def _render_fields(required_fields: int, optional_fields: int, dpi: int) -> str:
+    """
+    Render the required vs optional fields bar chart.
+    
+    Args:
+        required_fields: Number of required fields across all labels
+        optional_fields: Number of optional fields across all labels
+        dpi: Output resolution
         
-        Args:
-            usage_stats: Label usage statistics
-            audit_data: Audit log analysis
-            figure_paths: Paths to generated figures
-            lookback_days: Number of days included in activity data
-            
-        Returns:
-            HTML content as string
-        """
-        # Import pandas for HTML table generation
-        import pandas as pd
-        import base64
+    Returns:
+        PNG image as a base64 data URI
+    """
+    fig, ax = _new_figure(10, 8)
+    
+    # Create grouped bar chart
+    ax.bar(
+        ['Required Fields', 'Optional Fields'],
+        [required_fields, optional_fields],
+        color=['#1f77b4', '#aec7e8']
+    )
+    ax.xaxis.grid(False)
+    ax.set_title('Required vs Optional Fields', fontsize=16, pad=20)
+    ax.set_xlabel('Field Type', fontsize=14)
+    ax.set_ylabel('Count', fontsize=14)
+    ax.tick_params(labelsize=12)
+    
+    # Add count labels on top of each bar
+    ax.bar_label(ax.containers[0], fmt='%d', padding=3, fontsize=12)
+    
+    # Add percentage labels
+    total = required_fields + optional_fields
+    if total > 0:
+        req_pct = required_fields / total * 100
+        opt_pct = optional_fields / total * 100
         
-        # Function to encode images
-        def encode_image(image_path):
-            if image_path and os.path.exists(image_path):
-                with open(image_path, "rb") as image_file:
-                    encoded = base64.b64encode(image_file.read()).decode('utf-8')
-                    return f"data:image/png;base64,{encoded}"
-            return ""
+        ax.text(0, required_fields / 2, f"{req_pct:.1f}%", 
+                ha='center', va='center', fontsize=12, color='white', fontweight='bold')
+        ax.text(1, optional_fields / 2, f"{opt_pct:.1f}%", 
+                ha='center', va='center', fontsize=12, color='white', fontweight='bold')
+    
+    fig.tight_layout()
+    return _figure_to_data_uri(fig, dpi)
+
+
+def _render_activity(daily_df: Any, dpi: int) -> str:
+    """
+    Render the daily activity line chart.
+    
+    Args:
+        daily_df: DataFrame of daily action counts
+        dpi: Output resolution
         
-        # Convert figures to base64
-        figures = {}
-        for key, path in figure_paths.items():
-            figures[key] = encode_image(path)
+    Returns:
+        PNG image as a base64 data URI
+    """
+    import numpy as np
+    
+    # Fill in missing dates with zero counts by scattering each day's count
+    # into a dense array indexed by days since the first date
+    days = daily_df['date'].to_numpy().astype('datetime64[D]')
+    start = days.min()
+    offsets = (days - start).astype(np.int64)
+    counts = np.zeros(offsets.max() + 1, dtype=np.int64)
+    np.add.at(counts, offsets, daily_df['count'].to_numpy())
+    dates = start + np.arange(len(counts))
+    
+    fig, ax = _new_figure(14, 7)
+    
+    # Plot line chart with area fill
+    ax.plot(dates, counts, marker='o', linewidth=2, color='#1f77b4')
+    ax.fill_between(dates, counts, alpha=0.3, color='#1f77b4')
+    
+    ax.set_title('Daily Label Activity', fontsize=16, pad=20)
+    ax.set_xlabel('Date', fontsize=14)
+    ax.set_ylabel('Number of Actions', fontsize=14)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.tick_params(labelsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    
+    # Add rolling average
+    if len(counts) >= 3:  # Only add rolling average if enough data
+        # Trailing 3-day mean; the first days average over what is available
+        window_sums = np.convolve(counts, np.ones(3))[:len(counts)]
+        rolling_avg = window_sums / np.minimum(np.arange(1, len(counts) + 1), 3)
+        ax.plot(dates, rolling_avg, 
+                linestyle='--', linewidth=1.5, color='#ff7f0e', 
+                label='3-Day Rolling Average')
+        ax.legend(fontsize=12)
+    
+    fig.tight_layout()
+    return _figure_to_data_uri(fig, dpi)
+
+
+def _render_actions(action_df: Any, dpi: int) -> str:
+    """
+    Render the horizontal bar chart of actions by type.
+    
+    Args:
+        action_df: DataFrame of action counts, sorted by count descending
+        dpi: Output resolution
         
-        # Create DataFrame for tables
-        usage_df = pd.DataFrame(usage_stats)
+    Returns:
+        PNG image as a base64 data URI
+    """
+    fig, ax = _new_figure(12, 8)
+    
+    # Create horizontal bar chart
+    bar_colors = _palette('Blues_r', 0.0, 1.0, len(action_df) + 2)[1:-1]
+    bars = ax.barh(action_df['type'].to_numpy(), action_df['count'].to_numpy(), color=bar_colors)
+    
+    ax.set_title('Actions by Type', fontsize=16, pad=20)
+    ax.set_xlabel('Count', fontsize=14)
+    ax.set_ylabel('Action Type', fontsize=14)
+    ax.tick_params(labelsize=12)
+    
+    # Add count labels
+    ax.bar_label(bars, fmt='%d', padding=3, fontsize=12)
+    
+    fig.tight_layout()
+    return _figure_to_data_uri(fig, dpi)
+
+
+def _render_users(users_df: Any, dpi: int) -> str:
+    """
+    Render the horizontal bar chart of the most active users.
+    
+    Args:
+        users_df: DataFrame of the top users, sorted by count descending
+        dpi: Output resolution
         
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    Returns:
+        PNG image as a base64 data URI
+    """
+    fig, ax = _new_figure(12, 8)
+    
+    # Create horizontal bar chart
+    user_colors = _palette('Blues_r', 0.0, 1.0, len(users_df) + 2)[1:-1]
+    bars = ax.barh(users_df['user'].to_numpy(), users_df['count'].to_numpy(), color=user_colors)
+    
+    ax.set_title('Top Users by Activity', fontsize=16, pad=20)
+    ax.set_xlabel('Number of Actions', fontsize=14)
+    ax.set_ylabel('User', fontsize=14)
+    ax.tick_params(labelsize=12)
+    
+    # Add count labels
+    ax.bar_label(bars, fmt='%d', padding=3, fontsize=12)
+    
+    fig.tight_layout()
+    return _figure_to_data_uri(fig, dpi)
+
+
+def _figure_html(figures: Dict[str, str], key: str, alt: str) -> str:
+    """
+    Build the image tag for a chart, or a placeholder if it wasn't rendered.
+    
+    Args:
+        figures: Chart images keyed by chart name, as PNG data URIs
+        key: Chart name
+        alt: Alternative text for the image
         
-        # Get user data
-        user_data = {}
-        try:
-            user_data = self.statistics.auth_manager.get_current_user()
-        except:
-            user_data = {"email": "Unknown", "displayName": "Unknown"}
+    Returns:
+        HTML fragment
+    """
+    if key in figures:
+        return f'<img src="{figures[key]}" alt="{alt}">'
+    return "<p>No data available for visualization</p>"
+
+
+def _figure_section_html(figures: Dict[str, str], key: str, title: str, caption: str) -> str:
+    """
+    Build a titled figure block for a chart, or nothing if it wasn't rendered.
+    
+    Args:
+        figures: Chart images keyed by chart name, as PNG data URIs
+        key: Chart name
+        title: Heading shown above the chart
+        caption: Caption shown below the chart
         
-        # Calculate summary statistics
-        total_labels = len(usage_stats)
-        total_files = sum(item['file_count'] for item in usage_stats) if usage_stats else 0
-        published_labels = sum(1 for item in usage_stats if item['state'] == 'PUBLISHED')
-        disabled_labels = sum(1 for item in usage_stats if item['state'] == 'DISABLED')
-        total_fields = sum(item['fields'] for item in usage_stats) if usage_stats else 0
-        required_fields = sum(item['required_fields'] for item in usage_stats) if usage_stats else 0
-        avg_fields_per_label = total_fields / total_labels if total_labels > 0 else 0
+    Returns:
+        HTML fragment
+    """
+    if key not in figures:
+        return ''
+    return (
+        f'<div class="figure"><h3>{title}</h3><img src="{figures[key]}" alt="{title}">'
+        f'<p class="figure-caption">{caption}</p></div>'
+    )
+
+
+def _summarize_usage(usage_stats: List[Dict[str, Any]]) -> Tuple[int, int, int, int, int, int]:
+    """
+    Compute the label summary figures in a single pass over the usage statistics.
+    
+    Args:
+        usage_stats: Label usage statistics
         
-        # Build HTML content
-        html = f"""
+    Returns:
+        Tuple of (total labels, total files, published labels, disabled labels,
+        total fields, required fields)
+    """
+    total_files = published_labels = disabled_labels = total_fields = required_fields = 0
+    for item in usage_stats:
+        total_files += item['file_count']
+        total_fields += item['fields']
+        required_fields += item['required_fields']
+        state = item['state']
+        if state == 'PUBLISHED':
+            published_labels += 1
+        elif state == 'DISABLED':
+            disabled_labels += 1
+    
+    return (
+        len(usage_stats), total_files, published_labels, disabled_labels,
+        total_fields, required_fields
+    )
+
+
+def _html_table(rows: List[Dict[str, Any]], columns: List[str]) -> str:
+    """
+    Build an HTML table of the given columns, one row per dictionary.
+    
+    Args:
+        rows: Table rows
+        columns: Keys to show, in order; also used as the column headers
+        
+    Returns:
+        HTML fragment
+    """
+    header = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(row[column]))}</td>" for column in columns) + "</tr>"
+        for row in rows
+    )
+    return (
+        f'<table border="1" class="dataframe display"><thead><tr style="text-align: right;">{header}</tr></thead>'
+        f"<tbody>{body}</tbody></table>"
+    )
+
+
+# Static skeleton of the HTML report, filled in with str.format_map. Literal
+# braces in the CSS are doubled.
+_HTML_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -571,7 +618,7 @@ class ReportGenerator:
                 <h1>Google Drive Labels Usage Report</h1>
                 <p class="metadata">
                     Generated on: {timestamp}<br>
-                    Generated by: {user_data.get('displayName', 'Unknown')} ({user_data.get('email', 'Unknown')})
+                    Generated by: {user_name} ({user_email})
                 </p>
             </div>
             
@@ -587,7 +634,7 @@ class ReportGenerator:
                     <div class="stat-card">
                         <h3>Published Labels</h3>
                         <div class="stat-value">{published_labels}</div>
-                        <div class="stat-description">{published_labels/total_labels*100:.1f}% of total labels</div>
+                        <div class="stat-description">{published_pct:.1f}% of total labels</div>
                     </div>
                     <div class="stat-card">
                         <h3>Labeled Files</h3>
@@ -605,12 +652,12 @@ class ReportGenerator:
                     <h3>Key Insights</h3>
                     <p>
                         This report provides an analysis of Google Drive Labels usage across your organization.
-                        {f"Based on the last {lookback_days} days of activity, " if audit_data.get('actions_count') else ""}
-                        the data shows that {'your organization is actively using Drive Labels to organize and classify content' if total_files > 0 else 'Drive Labels adoption could be improved in your organization'}.
+                        {period_text}
+                        the data shows that {adoption_text}.
                     </p>
                     <p>
-                        {f"The most used label is '{usage_stats[0]['title']}' (applied to {usage_stats[0]['file_count']} files)" if usage_stats else ""}
-                        {f" and {published_labels} out of {total_labels} labels are published and available for use." if total_labels > 0 else ""}
+                        {top_label_text}
+                        {published_text}
                     </p>
                 </div>
             </div>
@@ -620,7 +667,7 @@ class ReportGenerator:
                 
                 <div class="figure">
                     <h3>Top Labels by Usage</h3>
-                    {"<img src=\"" + figures.get('top_labels', '') + "\" alt=\"Top Labels by Usage\">" if 'top_labels' in figures else "<p>No data available for visualization</p>"}
+                    {top_labels_figure}
                     <p class="figure-caption">
                         Frequency distribution of labels across files, showing which labels are most commonly applied.
                     </p>
@@ -628,7 +675,7 @@ class ReportGenerator:
                 
                 <div class="figure">
                     <h3>Label States</h3>
-                    {"<img src=\"" + figures.get('states', '') + "\" alt=\"Label States\">" if 'states' in figures else "<p>No data available for visualization</p>"}
+                    {states_figure}
                     <p class="figure-caption">
                         Distribution of label states (Published, Draft, Disabled) across your organization.
                     </p>
@@ -636,14 +683,14 @@ class ReportGenerator:
                 
                 <div class="figure">
                     <h3>Required vs Optional Fields</h3>
-                    {"<img src=\"" + figures.get('fields', '') + "\" alt=\"Required vs Optional Fields\">" if 'fields' in figures else "<p>No data available for visualization</p>"}
+                    {fields_figure}
                     <p class="figure-caption">
                         Breakdown of required and optional fields across all labels.
                     </p>
                 </div>
                 
                 <h3>Label Details</h3>
-                {usage_df[['title', 'state', 'file_count', 'fields', 'required_fields']].head(20).to_html(index=False, classes="display") if not usage_df.empty else "<p>No label data available</p>"}
+                {label_table}
                 
                 <p class="metadata">Note: Showing top 20 labels only. Total labels: {total_labels}</p>
             </div>
@@ -658,49 +705,49 @@ class ReportGenerator:
                 <div class="summary-stats">
                     <div class="stat-card">
                         <h3>Total Actions</h3>
-                        <div class="stat-value">{audit_data.get('actions_count', 0):,}</div>
+                        <div class="stat-value">{actions_count:,}</div>
                         <div class="stat-description">Label operations performed</div>
                     </div>
                     <div class="stat-card">
                         <h3>Active Users</h3>
-                        <div class="stat-value">{len(audit_data.get('users', []))}</div>
+                        <div class="stat-value">{active_users}</div>
                         <div class="stat-description">Users interacting with labels</div>
                     </div>
                     <div class="stat-card">
                         <h3>Peak Day</h3>
                         <div class="stat-value">
-                            {max(audit_data.get('daily_activity', [{'date': 'N/A', 'count': 0}]), key=lambda x: x['count'])['date'] if audit_data.get('daily_activity') else 'N/A'}
+                            {peak_day}
                         </div>
                         <div class="stat-description">Day with most activity</div>
                     </div>
                     <div class="stat-card">
                         <h3>Most Common Action</h3>
                         <div class="stat-value">
-                            {max(audit_data.get('action_types', [{'type': 'N/A', 'count': 0}]), key=lambda x: x['count'])['type'] if audit_data.get('action_types') else 'N/A'}
+                            {top_action}
                         </div>
                         <div class="stat-description">Most frequently performed</div>
                     </div>
                 </div>
                 
-                {f'<div class="figure"><h3>Daily Activity</h3><img src="{figures.get("activity", "")}" alt="Daily Activity"><p class="figure-caption">Activity trend showing label operations over time.</p></div>' if "activity" in figures else ''}
+                {activity_figure}
                 
-                {f'<div class="figure"><h3>Actions by Type</h3><img src="{figures.get("actions", "")}" alt="Actions by Type"><p class="figure-caption">Distribution of different types of label operations.</p></div>' if "actions" in figures else ''}
+                {actions_figure}
                 
-                {f'<div class="figure"><h3>User Activity</h3><img src="{figures.get("users", "")}" alt="User Activity"><p class="figure-caption">Top users by label activity.</p></div>' if "users" in figures else ''}
+                {users_figure}
                 
-                {f'<h3>User Activity Details</h3>{pd.DataFrame(audit_data.get("users", [])).head(10).to_html(index=False, classes="display")}' if audit_data.get('users') else '<p>No user activity data available</p>'}
+                {users_table}
                 
                 <p class="metadata">Note: Showing top 10 users only.</p>
                 
                 <div class="insights">
                     <h3>Activity Insights</h3>
                     <p>
-                        {f"Over the past {lookback_days} days, there have been {audit_data.get('actions_count', 0)} label-related operations performed by {len(audit_data.get('users', []))} users." if audit_data.get('actions_count') else "No activity data is available for analysis."}
-                        {f" The most common action was '{max(audit_data.get('action_types', [{'type': 'N/A', 'count': 0}]), key=lambda x: x['count'])['type']}', representing {max(audit_data.get('action_types', [{'type': 'N/A', 'count': 0}]), key=lambda x: x['count'])['count']} operations." if audit_data.get('action_types') else ""}
+                        {activity_summary}
+                        {top_action_text}
                     </p>
                     <p>
-                        {f"User engagement is {len(audit_data.get('users', [])) / 10:.1f}/10 based on the number of active users." if audit_data.get('users') else ""}
-                        {" Activity trends show " + ("increasing" if len(audit_data.get('daily_activity', [])) >= 2 and audit_data.get('daily_activity', [])[-1]['count'] > audit_data.get('daily_activity', [])[0]['count'] else "stable" if len(audit_data.get('daily_activity', [])) >= 2 and audit_data.get('daily_activity', [])[-1]['count'] == audit_data.get('daily_activity', [])[0]['count'] else "decreasing" if len(audit_data.get('daily_activity', [])) >= 2 else "unknown") + " usage over the analyzed period." if audit_data.get('daily_activity') else ""}
+                        {engagement_text}
+                        {trend_text}
                     </p>
                 </div>
             </div>
@@ -710,12 +757,12 @@ class ReportGenerator:
                 <div class="recommendations">
                     <h3>Optimize Label Structure</h3>
                     <p>
-                        {f"Currently, {required_fields} out of {total_fields} fields ({required_fields/total_fields*100:.1f}%) are marked as required." if total_fields > 0 else "No field data is available."}
-                        {" Consider reducing required fields to improve adoption if the ratio is above 30%." if total_fields > 0 and required_fields/total_fields > 0.3 else " Your balance of required vs. optional fields looks good." if total_fields > 0 else ""}
+                        {required_fields_text}
+                        {required_fields_advice}
                     </p>
                     <p>
-                        {f"There are {disabled_labels} disabled labels ({disabled_labels/total_labels*100:.1f}% of total)." if total_labels > 0 else ""}
-                        {" Consider cleaning up by deleting unused disabled labels to maintain a streamlined taxonomy." if disabled_labels > 0 else ""}
+                        {disabled_text}
+                        {disabled_advice}
                     </p>
                 </div>
                 
@@ -743,13 +790,417 @@ class ReportGenerator:
             
             <footer>
                 <p>Generated using Legal Drive Labels Manager v0.1.0</p>
-                <p>Report period: {(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')} to {datetime.now().strftime('%Y-%m-%d')}</p>
+                <p>Report period: {period_start} to {period_end}</p>
             </footer>
         </body>
         </html>
+"""
+
+
+class ReportGenerator:
+    """Generate visual reports for Drive Labels usage.
+    
+    This class provides tools for generating comprehensive reports on
+    label usage across your Google Drive environment.
+    
+    Attributes:
+        statistics: LabelStatistics instance for gathering data
+        _has_visualization_libs: Whether visualization libraries are available
+        _cache: Recently gathered statistics keyed by query, oldest first
+    """
+
+    # Maximum number of statistics results kept in _cache
+    _CACHE_SIZE = 8
+
+    # Shared across instances; None until the first availability check
+    _visualization_libs_available: Optional[bool] = None
+
+    def __init__(self, statistics: Optional[LabelStatistics] = None) -> None:
+        """
+        Initialize the report generator.
+        
+        Args:
+            statistics: Optional LabelStatistics instance
+        """
+        self.statistics = statistics or LabelStatistics()
+        self._has_visualization_libs = self._check_visualization_libraries()
+        self._cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+
+    def invalidate(self) -> None:
+        """Discard cached statistics so the next report fetches fresh data."""
+        self._cache.clear()
+
+    def _cached(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached statistics result, computing and storing it if needed.
+        
+        Args:
+            key: Cache key identifying the query
+            compute: Callable producing the result on a cache miss
+            
+        Returns:
+            The cached or freshly computed result
         """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
         
-        return html
+        result = compute()
+        self._cache[key] = result
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def _get_usage_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get label usage statistics, reusing the last result if available.
+        
+        The returned list is shared with the cache and must not be mutated.
+        
+        Returns:
+            List of label usage statistics
+        """
+        return self._cached(("usage",), self.statistics.count_labels_by_usage)
+
+    def _get_audit_data(self, lookback_days: int) -> Dict[str, Any]:
+        """
+        Get audit log analysis, reusing the last result for the same period.
+        
+        The returned dictionary is shared with the cache and must not be mutated.
+        
+        Args:
+            lookback_days: Number of days to include in the analysis
+            
+        Returns:
+            Dictionary with audit log analysis
+        """
+        return self._cached(
+            ("audit", lookback_days),
+            lambda: self.statistics.analyze_audit_log(days=lookback_days)
+        )
+
+    def _check_visualization_libraries(self) -> bool:
+        """
+        Check if visualization libraries are available.
+        
+        Returns:
+            True if visualization libraries are available, False otherwise
+        """
+        if ReportGenerator._visualization_libs_available is None:
+            # Locate the packages without importing them; they are only
+            # loaded once a report actually has something to chart
+            ReportGenerator._visualization_libs_available = all(
+                importlib.util.find_spec(name) is not None
+                for name in ("matplotlib", "pandas", "seaborn")
+            )
+        return ReportGenerator._visualization_libs_available
+
+    def _ensure_visualization_libraries(self) -> bool:
+        """
+        Ensure visualization libraries are available or provide installation instructions.
+        
+        Returns:
+            True if libraries are available, False otherwise
+        """
+        if not self._has_visualization_libs:
+            self.logger.warning("Visualization libraries are not installed.")
+            print("Visualization libraries are not installed.")
+            print("To install required packages:")
+            print("pip install pandas matplotlib seaborn")
+            return False
+        return True
+
+    def generate_usage_report(
+        self, 
+        output_path: Union[str, Path],
+        lookback_days: int = 30,
+        top_n_labels: int = 10,
+        include_disabled: bool = True,
+        dpi: int = 100
+    ) -> bool:
+        """
+        Generate a comprehensive HTML report on label usage.
+        
+        Args:
+            output_path: Path to save the HTML report
+            lookback_days: Number of days to include in activity analysis
+            top_n_labels: Number of top labels to highlight
+            include_disabled: Whether to include disabled labels in statistics
+            dpi: Resolution of the embedded chart images
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._ensure_visualization_libraries():
+            return False
+        
+        # Get label usage statistics and audit log data
+        usage_stats = self._get_usage_stats()
+        audit_data = self._get_audit_data(lookback_days)
+        
+        # Only load pandas and seaborn when there is something to chart
+        figures: Dict[str, str] = {}
+        if usage_stats or any(audit_data.get(key) for key in ('daily_activity', 'action_types', 'users')):
+            figures = self._render_charts(
+                usage_stats,
+                audit_data,
+                top_n_labels=top_n_labels,
+                include_disabled=include_disabled,
+                dpi=dpi
+            )
+        
+        # Generate HTML report
+        html_content = self._generate_html_report(
+            usage_stats, 
+            audit_data, 
+            figures,
+            lookback_days=lookback_days
+        )
+        
+        # Write HTML to file, encoded once up front (the page declares UTF-8)
+        try:
+            with open(output_path, 'wb', buffering=_REPORT_WRITE_BUFFER) as f:
+                f.write(html_content.encode('utf-8'))
+        except OSError as e:
+            self.logger.error(f"Error writing report to {output_path}: {e}")
+            print(f"Error writing report to {output_path}: {e}")
+            return False
+        
+        self.logger.info(f"HTML report generated successfully: {output_path}")
+        return True
+
+    def _render_charts(
+        self,
+        usage_stats: List[Dict[str, Any]],
+        audit_data: Dict[str, Any],
+        top_n_labels: int = 10,
+        include_disabled: bool = True,
+        dpi: int = 100
+    ) -> Dict[str, str]:
+        """
+        Render the report charts.
+        
+        Args:
+            usage_stats: Label usage statistics
+            audit_data: Audit log analysis
+            top_n_labels: Number of top labels to highlight
+            include_disabled: Whether to include disabled labels in statistics
+            dpi: Resolution of the chart images
+            
+        Returns:
+            Chart images keyed by chart name, as PNG data URIs
+        """
+        import matplotlib
+        import pandas as pd
+        import seaborn as sns
+        
+        # Set seaborn style
+        sns.set_style("whitegrid")
+        
+        # Collect the charts to draw as (name, renderer, arguments). Each
+        # chart's data is prepared in its own try, so a dataset that can't
+        # be prepared leaves out only that chart
+        chart_tasks: List[Tuple[str, Callable[..., str], Tuple[Any, ...]]] = []
+        
+        # Convert to DataFrame for easier manipulation
+        try:
+            df = pd.DataFrame(usage_stats)
+            
+            # Filter out disabled labels if requested
+            if not include_disabled and not df.empty:
+                df = df[df['state'] != 'DISABLED']
+        except Exception:
+            self.logger.exception("Error preparing label chart data")
+            df = pd.DataFrame()
+        
+        # Label charts, each drawn from aggregates computed once here
+        if len(df) > 0:  # Only create if there are labels
+            # 1. Bar chart of top labels by usage
+            try:
+                top_df = df.nlargest(min(top_n_labels, len(df)), 'file_count')
+                chart_tasks.append(('top_labels', _render_top_labels, (top_df, dpi)))
+            except Exception:
+                self.logger.exception("Error preparing top_labels chart")
+            
+            # 2. Pie chart of label states
+            try:
+                state_counts = df['state'].value_counts()
+                if len(state_counts) > 0:  # Only create if there are states
+                    chart_tasks.append(('states', _render_states, (state_counts, dpi)))
+            except Exception:
+                self.logger.exception("Error preparing states chart")
+            
+            # 3. Required vs Optional Fields chart
+            try:
+                field_totals = df[['fields', 'required_fields']].sum()
+                total_fields = field_totals['fields']
+                required_fields = field_totals['required_fields']
+                if total_fields > 0:  # Only create if there are fields
+                    chart_tasks.append((
+                        'fields', _render_fields,
+                        (required_fields, total_fields - required_fields, dpi)
+                    ))
+            except Exception:
+                self.logger.exception("Error preparing fields chart")
+        
+        # 4. Daily activity chart
+        if audit_data.get('daily_activity'):
+            try:
+                daily_df = pd.DataFrame(audit_data['daily_activity'])
+                daily_df['date'] = pd.to_datetime(daily_df['date'])
+                chart_tasks.append(('activity', _render_activity, (daily_df, dpi)))
+            except Exception:
+                self.logger.exception("Error preparing activity chart")
+        
+        # 5. Action types chart
+        if audit_data.get('action_types'):
+            try:
+                action_df = pd.DataFrame(audit_data['action_types'])
+                action_df = action_df.sort_values('count', ascending=False)
+                chart_tasks.append(('actions', _render_actions, (action_df, dpi)))
+            except Exception:
+                self.logger.exception("Error preparing actions chart")
+        
+        # 6. Users activity chart (top 10 users only)
+        if audit_data.get('users'):
+            try:
+                users_df = pd.DataFrame(audit_data['users']).nlargest(10, 'count')
+                chart_tasks.append(('users', _render_users, (users_df, dpi)))
+            except Exception:
+                self.logger.exception("Error preparing users chart")
+        
+        # Charts are independent and Agg releases the GIL while
+        # rasterizing and encoding, so render them concurrently. Each
+        # renderer builds its own Figure, which keeps this thread-safe.
+        # rcParams are global, so the line settings are applied around the
+        # whole pool rather than inside the activity renderer; only long
+        # polylines are affected by them.
+        figures: Dict[str, str] = {}
+        if chart_tasks:
+            with matplotlib.rc_context(_LINE_RENDER_RC), \
+                    ThreadPoolExecutor(max_workers=min(4, len(chart_tasks))) as executor:
+                futures = [
+                    (key, executor.submit(render, *args))
+                    for key, render, args in chart_tasks
+                ]
+                for key, future in futures:
+                    # A chart that fails to render is left out of the report,
+                    # which shows a placeholder in its place
+                    try:
+                        figures[key] = future.result()
+                    except Exception:
+                        self.logger.exception(f"Error rendering {key} chart")
+        
+        return figures
+
+    def _generate_html_report(
+        self, 
+        usage_stats: List[Dict[str, Any]], 
+        audit_data: Dict[str, Any],
+        figures: Dict[str, str],
+        lookback_days: int = 30
+    ) -> str:
+        """
+        Generate HTML content for the report.
+        
+        Args:
+            usage_stats: Label usage statistics
+            audit_data: Audit log analysis
+            figures: Chart images keyed by chart name, as PNG data URIs
+            lookback_days: Number of days included in activity data
+            
+        Returns:
+            HTML content as string
+        """
+        # Generate timestamp and report period from a single clock reading
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        period_start = (now - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        period_end = now.strftime('%Y-%m-%d')
+        
+        # Get user data
+        user_data = {}
+        try:
+            user_data = self.statistics.auth_manager.get_current_user()
+        except:
+            user_data = {"email": "Unknown", "displayName": "Unknown"}
+        
+        # Calculate summary statistics
+        (total_labels, total_files, published_labels, disabled_labels,
+         total_fields, required_fields) = _summarize_usage(usage_stats)
+        avg_fields_per_label = total_fields / total_labels if total_labels > 0 else 0
+        
+        # Percentages, guarded so an empty account doesn't divide by zero
+        published_pct = published_labels / total_labels * 100 if total_labels > 0 else 0.0
+        disabled_pct = disabled_labels / total_labels * 100 if total_labels > 0 else 0.0
+        required_pct = required_fields / total_fields * 100 if total_fields > 0 else 0.0
+        
+        # Audit aggregates, each looked up and scanned once
+        actions_count = audit_data.get('actions_count', 0)
+        users = audit_data.get('users') or []
+        action_types = audit_data.get('action_types') or []
+        daily_activity = audit_data.get('daily_activity') or []
+        by_count = itemgetter('count')
+        top_action = max(action_types, key=by_count) if action_types else {'type': 'N/A', 'count': 0}
+        peak_day = max(daily_activity, key=by_count) if daily_activity else {'date': 'N/A', 'count': 0}
+        
+        # Activity trend, comparing the first and last day of the period
+        if len(daily_activity) >= 2:
+            first_count = daily_activity[0]['count']
+            last_count = daily_activity[-1]['count']
+            if last_count > first_count:
+                trend = "increasing"
+            elif last_count == first_count:
+                trend = "stable"
+            else:
+                trend = "decreasing"
+        else:
+            trend = "unknown"
+        
+        # Dynamic fragments, filled into the module-level template. Values
+        # that come from Drive (names, titles) are escaped here; the template
+        # itself is trusted markup.
+        ctx = {
+            "timestamp": timestamp,
+            "user_name": html.escape(str(user_data.get('displayName', 'Unknown'))),
+            "user_email": html.escape(str(user_data.get('email', 'Unknown'))),
+            "total_labels": total_labels,
+            "published_labels": published_labels,
+            "published_pct": published_pct,
+            "total_files": total_files,
+            "total_fields": total_fields,
+            "avg_fields_per_label": avg_fields_per_label,
+            "period_text": f"Based on the last {lookback_days} days of activity, " if actions_count else "",
+            "adoption_text": 'your organization is actively using Drive Labels to organize and classify content' if total_files > 0 else 'Drive Labels adoption could be improved in your organization',
+            "top_label_text": f"The most used label is '{html.escape(str(usage_stats[0]['title']))}' (applied to {usage_stats[0]['file_count']} files)" if usage_stats else "",
+            "published_text": f" and {published_labels} out of {total_labels} labels are published and available for use." if total_labels > 0 else "",
+            "top_labels_figure": _figure_html(figures, 'top_labels', 'Top Labels by Usage'),
+            "states_figure": _figure_html(figures, 'states', 'Label States'),
+            "fields_figure": _figure_html(figures, 'fields', 'Required vs Optional Fields'),
+            "label_table": _html_table(usage_stats[:20], ['title', 'state', 'file_count', 'fields', 'required_fields']) if usage_stats else "<p>No label data available</p>",
+            "lookback_days": lookback_days,
+            "actions_count": actions_count,
+            "active_users": len(users),
+            "peak_day": peak_day['date'],
+            "top_action": html.escape(str(top_action['type'])),
+            "activity_figure": _figure_section_html(figures, 'activity', 'Daily Activity', 'Activity trend showing label operations over time.'),
+            "actions_figure": _figure_section_html(figures, 'actions', 'Actions by Type', 'Distribution of different types of label operations.'),
+            "users_figure": _figure_section_html(figures, 'users', 'User Activity', 'Top users by label activity.'),
+            "users_table": f'<h3>User Activity Details</h3>{_html_table(users[:10], ["user", "count"])}' if users else '<p>No user activity data available</p>',
+            "activity_summary": f"Over the past {lookback_days} days, there have been {actions_count} label-related operations performed by {len(users)} users." if actions_count else "No activity data is available for analysis.",
+            "top_action_text": f" The most common action was '{html.escape(str(top_action['type']))}', representing {top_action['count']} operations." if action_types else "",
+            "engagement_text": f"User engagement is {len(users) / 10:.1f}/10 based on the number of active users." if users else "",
+            "trend_text": f" Activity trends show {trend} usage over the analyzed period." if daily_activity else "",
+            "required_fields_text": f"Currently, {required_fields} out of {total_fields} fields ({required_pct:.1f}%) are marked as required." if total_fields > 0 else "No field data is available.",
+            "required_fields_advice": " Consider reducing required fields to improve adoption if the ratio is above 30%." if total_fields > 0 and required_pct > 30 else " Your balance of required vs. optional fields looks good." if total_fields > 0 else "",
+            "disabled_text": f"There are {disabled_labels} disabled labels ({disabled_pct:.1f}% of total)." if total_labels > 0 else "",
+            "disabled_advice": " Consider cleaning up by deleting unused disabled labels to maintain a streamlined taxonomy." if disabled_labels > 0 else "",
+            "period_start": period_start,
+            "period_end": period_end,
+        }
+        
+        return _HTML_TEMPLATE.format_map(ctx)
 
     def create_text_report(self, lookback_days: int = 30) -> str:
         """
@@ -762,126 +1213,120 @@ class ReportGenerator:
             Formatted text report
         """
         # Get label usage statistics
-        usage_stats = self.statistics.count_labels_by_usage()
+        usage_stats = self._get_usage_stats()
         
         # Get audit data
-        audit_data = self.statistics.analyze_audit_log(days=lookback_days)
+        audit_data = self._get_audit_data(lookback_days)
         
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Generate timestamp and report period from a single clock reading
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        period_start = (now - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        period_end = now.strftime('%Y-%m-%d')
         
         # Calculate summary statistics
-        total_labels = len(usage_stats)
-        total_files = sum(item['file_count'] for item in usage_stats) if usage_stats else 0
-        published_labels = sum(1 for item in usage_stats if item['state'] == 'PUBLISHED')
-        disabled_labels = sum(1 for item in usage_stats if item['state'] == 'DISABLED')
-        total_fields = sum(item['fields'] for item in usage_stats) if usage_stats else 0
-        required_fields = sum(item['required_fields'] for item in usage_stats) if usage_stats else 0
-        
-        # Build report sections
+        (total_labels, total_files, published_labels, disabled_labels,
+         total_fields, required_fields) = _summarize_usage(usage_stats)
+        
+        # Build report sections, each added in a single extend
         report = []
         
         # Header
-        report.append("=" * 80)
-        report.append("GOOGLE DRIVE LABELS USAGE REPORT")
-        report.append("=" * 80)
-        report.append(f"Generated on: {timestamp}")
-        report.append(f"Period: Last {lookback_days} days")
-        report.append("")
+        report.extend((
+            "=" * 80,
+            "GOOGLE DRIVE LABELS USAGE REPORT",
+            "=" * 80,
+            f"Generated on: {timestamp}",
+            f"Period: Last {lookback_days} days",
+            "",
+        ))
         
         # Summary section
-        report.append("-" * 40)
-        report.append("SUMMARY")
-        report.append("-" * 40)
-        report.append(f"Total labels: {total_labels}")
-        report.append(f"Published labels: {published_labels}")
-        report.append(f"Disabled labels: {disabled_labels}")
-        report.append(f"Total files with labels: {total_files}")
-        report.append(f"Total fields across all labels: {total_fields}")
-        report.append(f"Required fields: {required_fields} ({required_fields/total_fields*100:.1f}% of total)" if total_fields > 0 else "Required fields: 0")
-        report.append(f"Active users: {len(audit_data.get('users', []))}")
-        report.append(f"Total actions recorded: {audit_data.get('actions_count', 0)}")
-        report.append("")
-        
-        # Top labels section
-        report.append("-" * 40)
-        report.append("TOP 10 LABELS BY USAGE")
-        report.append("-" * 40)
-        report.append(f"{'LABEL':<40} {'STATE':<15} {'FILES':<10} {'FIELDS':<10}")
-        report.append("-" * 75)
-        
-        # Sort by usage
-        sorted_stats = sorted(usage_stats, key=lambda x: x['file_count'], reverse=True)
-        
-        for item in sorted_stats[:10]:
-            report.append(f"{item['title']:<40} {item['state']:<15} {item['file_count']:<10} {item['fields']:<10}")
+        report.extend((
+            "-" * 40,
+            "SUMMARY",
+            "-" * 40,
+            f"Total labels: {total_labels}",
+            f"Published labels: {published_labels}",
+            f"Disabled labels: {disabled_labels}",
+            f"Total files with labels: {total_files}",
+            f"Total fields across all labels: {total_fields}",
+            f"Required fields: {required_fields} ({required_fields/total_fields*100:.1f}% of total)" if total_fields > 0 else "Required fields: 0",
+            f"Active users: {len(audit_data.get('users', []))}",
+            f"Total actions recorded: {audit_data.get('actions_count', 0)}",
+            "",
+        ))
         
+        # Top labels section (ten most used labels)
+        report.extend((
+            "-" * 40,
+            "TOP 10 LABELS BY USAGE",
+            "-" * 40,
+            f"{'LABEL':<40} {'STATE':<15} {'FILES':<10} {'FIELDS':<10}",
+            "-" * 75,
+        ))
+        report.extend(
+            _LABEL_ROW_FORMAT.format_map(item)
+            for item in nlargest(10, usage_stats, key=itemgetter('file_count'))
+        )
         report.append("")
         
         # Activity section
         if audit_data.get('action_types'):
-            report.append("-" * 40)
-            report.append("ACTIVITY BY TYPE")
-            report.append("-" * 40)
-            report.append(f"{'ACTION TYPE':<40} {'COUNT':<10}")
-            report.append("-" * 50)
+            report.extend((
+                "-" * 40,
+                "ACTIVITY BY TYPE",
+                "-" * 40,
+                f"{'ACTION TYPE':<40} {'COUNT':<10}",
+                "-" * 50,
+            ))
             
-            # Sort by count
-            sorted_actions = sorted(audit_data['action_types'], key=lambda x: x['count'], reverse=True)
-            
-            for item in sorted_actions:
-                report.append(f"{item['type']:<40} {item['count']:<10}")
-                
+            # Sort by count; every action type is listed
+            sorted_actions = sorted(audit_data['action_types'], key=itemgetter('count'), reverse=True)
+            report.extend(_ACTION_ROW_FORMAT.format_map(item) for item in sorted_actions)
             report.append("")
         
-        # Top users section
+        # Top users section (five most active users)
         if audit_data.get('users'):
-            report.append("-" * 40)
-            report.append("TOP USERS")
-            report.append("-" * 40)
-            report.append(f"{'USER':<50} {'ACTIONS':<10}")
-            report.append("-" * 60)
-            
-            # Sort by count
-            sorted_users = sorted(audit_data['users'], key=lambda x: x['count'], reverse=True)
-            
-            for item in sorted_users[:5]:
-                report.append(f"{item['user']:<50} {item['count']:<10}")
-                
+            report.extend((
+                "-" * 40,
+                "TOP USERS",
+                "-" * 40,
+                f"{'USER':<50} {'ACTIONS':<10}",
+                "-" * 60,
+            ))
+            report.extend(
+                _USER_ROW_FORMAT.format_map(item)
+                for item in nlargest(5, audit_data['users'], key=itemgetter('count'))
+            )
             report.append("")
         
         # Daily activity summary
         if audit_data.get('daily_activity'):
-            report.append("-" * 40)
-            report.append("DAILY ACTIVITY SUMMARY")
-            report.append("-" * 40)
-            
             # Find peak day
             peak_day = max(audit_data['daily_activity'], key=lambda x: x['count']) if audit_data['daily_activity'] else {'date': 'N/A', 'count': 0}
             
-            report.append(f"Peak day: {peak_day['date']} with {peak_day['count']} actions")
-            
             # Calculate average daily actions
             avg_actions = sum(day['count'] for day in audit_data['daily_activity']) / len(audit_data['daily_activity']) if audit_data['daily_activity'] else 0
             
-            report.append(f"Average daily actions: {avg_actions:.1f}")
-            report.append("")
+            report.extend((
+                "-" * 40,
+                "DAILY ACTIVITY SUMMARY",
+                "-" * 40,
+                f"Peak day: {peak_day['date']} with {peak_day['count']} actions",
+                f"Average daily actions: {avg_actions:.1f}",
+                "",
+            ))
         
         # Recommendations
-        report.append("-" * 40)
-        report.append("RECOMMENDATIONS")
-        report.append("-" * 40)
-        report.append("1. Regularly review unused labels to maintain a clean environment.")
-        report.append("2. Consider standardizing label naming conventions for better organization.")
-        report.append("3. Provide training to users on proper label application.")
-        report.append("4. Review required fields to ensure they add value without creating barriers.")
-        report.append("5. Set up regular reporting to monitor label usage trends.")
-        report.append("")
+        report.extend(_TEXT_REPORT_RECOMMENDATIONS)
         
         # Footer
-        report.append("=" * 80)
-        report.append("Generated using Legal Drive Labels Manager v0.1.0")
-        report.append(f"Report period: {(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')} to {datetime.now().strftime('%Y-%m-%d')}")
-        report.append("=" * 80)
+        report.extend((
+            "=" * 80,
+            "Generated using Legal Drive Labels Manager v0.1.0",
+            f"Report period: {period_start} to {period_end}",
+            "=" * 80,
+        ))
         
         return "\n".join(report)
\ No newline at end of file
@@ -42,7 +42,7 @@ setup(
     extras_require={
         'visualization': [
             'pandas>=1.0.0',
-            'matplotlib>=3.0.0',
+            'matplotlib>=3.4.0',
             'seaborn>=0.11.0',
         ],
         'dev': [
@@ -8,6 +8,13 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader and dumper when PyYAML was built with it;
+# they accept and produce the same documents as the pure-Python versions.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 # Default configuration
 DEFAULT_CONFIG = {
     "auth": {
@@ -85,19 +92,17 @@ class Config:
         """
         config = DEFAULT_CONFIG.copy()
         
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    file_config = yaml.safe_load(f)
-                
-                if file_config:
-                    # Merge file config with defaults
-                    self._merge_configs(config, file_config)
-                    logger.debug(f"Loaded configuration from {self.config_path}")
-            except Exception as e:
-                logger.warning(f"Error loading configuration from {self.config_path}: {e}")
-                logger.warning("Using default configuration")
-        else:
+        # Open the file directly rather than checking for it first, which
+        # saves a stat call on every startup
+        try:
+            with open(self.config_path, 'r') as f:
+                file_config = yaml.load(f, Loader=_YamlLoader)
+            
+            if file_config:
+                # Merge file config with defaults
+                self._merge_configs(config, file_config)
+                logger.debug(f"Loaded configuration from {self.config_path}")
+        except FileNotFoundError:
             logger.debug(f"No configuration file found at {self.config_path}, using defaults")
             
             # Create an example config file if it doesn't exist
@@ -105,6 +110,9 @@ class Config:
                 self._create_example_config()
             except Exception as e:
                 logger.debug(f"Could not create example config: {e}")
+        except Exception as e:
+            logger.warning(f"Error loading configuration from {self.config_path}: {e}")
+            logger.warning("Using default configuration")
         
         return config
     
@@ -217,7 +225,7 @@ ui:
         """
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False)
             logger.debug(f"Saved configuration to {self.config_path}")
             return True
         except Exception as e:
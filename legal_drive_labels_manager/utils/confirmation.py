@@ -126,6 +126,10 @@ def prompt_for_choice(
     # Default choice text
     default_text = f" [{default+1}]" if default is not None else ""
     
+    # Case-insensitive lookup for typed-out choices; built from the end so
+    # the first of any case-insensitive duplicates wins
+    choices_by_name = {choice.lower(): choice for choice in reversed(choices)}
+    
     # Loop until valid selection
     while True:
         try:
@@ -144,9 +148,9 @@ def prompt_for_choice(
                     print(f"Please enter a number between 1 and {len(choices)}.")
             except ValueError:
                 # Check if response matches a choice
-                matches = [choice for choice in choices if choice.lower() == response.lower()]
-                if matches:
-                    return matches[0]
+                match = choices_by_name.get(response.lower())
+                if match is not None:
+                    return match
                 else:
                     print(f"Please enter a number between 1 and {len(choices)}.")
         except KeyboardInterrupt:
@@ -1,7 +1,6 @@
 """Text formatting utilities for CLI output."""
 
 import textwrap
-import re
 from typing import Dict, List, Optional, Any, Tuple
 
 
@@ -33,34 +32,29 @@ class TextFormatter:
         # Use column names as headers if not provided
         headers = headers or columns
         
+        # Stringify every cell once; the same strings size the columns and
+        # fill the rows
+        cells = [[str(row.get(col, '')) for col in columns] for row in data]
+        
         # Calculate column widths if not provided
         if not widths:
-            widths = []
-            for i, col in enumerate(columns):
-                # Start with header width
-                col_width = len(headers[i])
-                
-                # Find maximum data width
-                for row in data:
-                    if col in row:
-                        col_width = max(col_width, len(str(row[col])))
-                
-                # Limit width to reasonable maximum
-                widths.append(min(col_width, 40))
+            widths = [
+                # Widest of header and data, limited to a reasonable maximum
+                min(max(len(header), *map(len, column_cells)), 40)
+                for header, column_cells in zip(headers, zip(*cells))
+            ]
         
         # Create the header row
         header_row = " | ".join(
-            f"{header:<{width}}" for header, width in zip(headers, widths)
+            header.ljust(width) for header, width in zip(headers, widths)
         )
         separator = "-+-".join("-" * width for width in widths)
         
         # Create the data rows
-        rows = []
-        for row in data:
-            formatted_row = " | ".join(
-                f"{str(row.get(col, '')):<{width}}" for col, width in zip(columns, widths)
-            )
-            rows.append(formatted_row)
+        rows = [
+            " | ".join(cell.ljust(width) for cell, width in zip(row_cells, widths))
+            for row_cells in cells
+        ]
         
         # Combine everything
         return "\n".join([header_row, separator] + rows)
@@ -76,24 +70,30 @@ class TextFormatter:
         Returns:
             Formatted label description
         """
+        get = label.get
         lines = [
-            f"Label: {label.get('title', 'Unknown')} ({label.get('id', 'Unknown')})",
-            f"Status: {label.get('state', 'Unknown')}",
+            f"Label: {get('title', 'Unknown')} ({get('id', 'Unknown')})",
+            f"Status: {get('state', 'Unknown')}",
         ]
         
-        if label.get("description"):
-            lines.append(f"Description: {label['description']}")
+        description = get("description")
+        if description:
+            lines.append(f"Description: {description}")
         
         lines.append("\nFields:")
-        if label.get("fields"):
-            for field in label["fields"]:
-                lines.append(f"  - {field.get('name', 'Unnamed')} ({field.get('id', '')})")
-                lines.append(f"    Type: {field.get('type', 'Unknown')}")
-                lines.append(f"    Required: {'Yes' if field.get('required') else 'No'}")
+        fields = get("fields")
+        if fields:
+            for field in fields:
+                field_get = field.get
+                field_type = field_get('type', 'Unknown')
+                lines.append(f"  - {field_get('name', 'Unnamed')} ({field_get('id', '')})")
+                lines.append(f"    Type: {field_type}")
+                lines.append(f"    Required: {'Yes' if field_get('required') else 'No'}")
                 
                 # Show options for selection fields
-                if field.get("type") == "SELECTION" and field.get("options"):
-                    option_names = [opt.get("name", "Unnamed") for opt in field["options"]]
+                options = field_get("options")
+                if field_type == "SELECTION" and options:
+                    option_names = [opt.get("name", "Unnamed") for opt in options]
                     lines.append(f"    Options: {', '.join(option_names)}")
                     
                 lines.append("")  # Empty line between fields
@@ -204,16 +204,12 @@ class TextFormatter:
         else:
             base_label_id = label_id
             
-        # Get core fields for description
-        core_field_names = []
-        for field in label.get("fields", []):
-            core_field_names.append(field.get('name', 'Unnamed'))
-            
-        # Format description as comma-separated list
-        description = ", ".join(core_field_names)
+        # Format description as comma-separated list of the field names
+        fields = label.get("fields") or []
+        description = ", ".join(field.get('name', 'Unnamed') for field in fields)
         
-        # Build summary table
-        summary = [
+        # Build summary table and the head of the fields table in one list
+        lines = [
             f"### 📌 Label Summary: `{label.get('title', 'Unknown')}`",
             "",
             "| Property       | Value                                            |",
@@ -224,26 +220,22 @@ class TextFormatter:
             f"| **Description**| {description} |",
             "",
             "---",
-            ""
-        ]
-        
-        # Build fields table
-        fields_table = [
+            "",
             "### 📋 Label Fields:",
             "",
             "| Field Name        | Field ID      | Type    | Required |",
             "|-------------------|---------------|---------|----------|"
         ]
         
-        if label.get("fields"):
-            for field in label.get("fields", []):
-                # Format required as checkmark or X
-                required = "✅ Yes" if field.get('required') else "❌ No"
-                fields_table.append(
-                    f"| {field.get('name', 'Unnamed')} | `{field.get('id', '')}` | {field.get('type', 'UNKNOWN')} | {required} |"
-                )
+        # Add one row per field, with required shown as checkmark or X
+        if fields:
+            lines.extend(
+                f"| {field.get('name', 'Unnamed')} | `{field.get('id', '')}` | {field.get('type', 'UNKNOWN')} | "
+                f"{'✅ Yes' if field.get('required') else '❌ No'} |"
+                for field in fields
+            )
         else:
-            fields_table.append("| No fields defined | | | |")
+            lines.append("| No fields defined | | | |")
             
         # Combine everything
-        return "\n".join(summary + fields_table)
+        return "\n".join(lines)
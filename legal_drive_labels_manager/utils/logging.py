@@ -1,12 +1,86 @@
 """Audit logging utilities for Drive Labels operations."""
 
+import atexit
 import csv
 import datetime
+import io
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Column layout of the audit log CSV
+_AUDIT_LOG_HEADER = ["timestamp", "user", "action", "target_id", "description"]
+
+# Block size for reading the audit log backwards from its end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """
+    Resolve the platform config directory once per process.
+    
+    Returns:
+        Path to config directory
+    """
+    system = platform.system()
+    
+    if system == "Windows":
+        base_dir = Path(os.environ.get("APPDATA", ""))
+        return base_dir / "drive_labels"
+    
+    # Linux/MacOS follow XDG spec
+    base_dir = Path(os.environ.get("XDG_CONFIG_HOME", ""))
+    if not base_dir.is_absolute():
+        base_dir = Path(os.path.expanduser("~/.config"))
+        
+    return base_dir / "drive_labels"
+
+
+def _first_record_start(data: bytes) -> int:
+    """
+    Find where the first complete record starts in a tail of the audit log.
+    
+    The log is written by csv.writer, which quotes any field containing a
+    quote and doubles the quotes inside it. A newline therefore ends a record
+    only when an even number of quote characters follow it up to the end of
+    the log; other newlines sit inside quoted multi-line descriptions.
+    
+    Args:
+        data: Bytes running from some offset to the end of the log
+        
+    Returns:
+        Offset just past the first record-ending newline, or -1 if none
+    """
+    quotes_after = data.count(b'"')
+    search_from = 0
+    while True:
+        newline = data.find(b"\n", search_from)
+        if newline == -1:
+            return -1
+            
+        quotes_after -= data.count(b'"', search_from, newline)
+        if quotes_after % 2 == 0:
+            return newline + 1
+            
+        search_from = newline + 1
+
+
+def _parse_audit_rows(data: bytes) -> list:
+    """
+    Parse raw audit log bytes into CSV records.
+    
+    Args:
+        data: UTF-8 encoded CSV data without the header line
+        
+    Returns:
+        List of non-empty records, each a list of field values
+    """
+    reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+    return [row for row in reader if row]
+
 
 class AuditLogger:
     """Logger for audit trail of operations on labels and files."""
@@ -21,6 +95,10 @@ class AuditLogger:
         self.config_dir = config_dir or self._get_config_dir()
         self.log_file_path = self.config_dir / "audit_log.csv"
         
+        # Append handle and CSV writer, opened on the first logged action
+        self._log_file = None
+        self._writer = None
+        
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
@@ -31,18 +109,35 @@ class AuditLogger:
         Returns:
             Path to config directory
         """
-        system = platform.system()
+        return _default_config_dir()
+
+    def _open_log(self) -> None:
+        """Open the audit log for appending, writing the header if it is empty."""
+        self._log_file = open(self.log_file_path, "a", newline="")
+        self._writer = csv.writer(self._log_file)
         
-        if system == "Windows":
-            base_dir = Path(os.environ.get("APPDATA", ""))
-            return base_dir / "drive_labels"
+        # Make sure the handle is closed at exit if the owner never closes it
+        atexit.register(self.close)
         
-        # Linux/MacOS follow XDG spec
-        base_dir = Path(os.environ.get("XDG_CONFIG_HOME", ""))
-        if not base_dir.is_absolute():
-            base_dir = Path.home() / ".config"
-            
-        return base_dir / "drive_labels"
+        # Write header if new file
+        if os.fstat(self._log_file.fileno()).st_size == 0:
+            self._writer.writerow(_AUDIT_LOG_HEADER)
+
+    def close(self) -> None:
+        """Close the audit log file handle, if open."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            self._writer = None
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> "AuditLogger":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
 
     def log_action(self, action_type: str, target_id: str, description: str) -> None:
         """
@@ -61,22 +156,16 @@ class AuditLogger:
             # In a future implementation, this could get user information from
             # the current authentication context
             
-            # Check if log file exists
-            log_exists = self.log_file_path.exists()
+            # Keep the file open across actions instead of reopening it
+            # for every entry
+            if self._writer is None:
+                self._open_log()
             
-            with open(self.log_file_path, "a", newline="") as f:
-                writer = csv.writer(f)
-                
-                # Write header if new file
-                if not log_exists:
-                    writer.writerow([
-                        "timestamp", "user", "action", "target_id", "description"
-                    ])
-                
-                # Write log entry
-                writer.writerow([
-                    timestamp, user_email, action_type, target_id, description
-                ])
+            # Write log entry, flushed so readers of the log see it at once
+            self._writer.writerow([
+                timestamp, user_email, action_type, target_id, description
+            ])
+            self._log_file.flush()
                 
         except Exception as e:
             print(f"Warning: Failed to log action: {e}")
@@ -91,19 +180,41 @@ class AuditLogger:
         Returns:
             List of recent actions
         """
-        if not self.log_file_path.exists():
+        if limit <= 0 or not self.log_file_path.exists():
             return []
             
         try:
-            actions = []
-            with open(self.log_file_path, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    actions.append(dict(row))
+            with open(self.log_file_path, "rb") as f:
+                header = next(csv.reader([f.readline().decode("utf-8")]), [])
+                data_start = f.tell()
+                
+                # Entries are appended in chronological order, so read
+                # backwards from the end until the tail holds `limit` complete
+                # records rather than parsing the whole log
+                pos = f.seek(0, os.SEEK_END)
+                block_size = _TAIL_BLOCK_SIZE
+                tail = b""
+                rows = []
+                while pos > data_start:
+                    step = min(block_size, pos - data_start)
+                    pos -= step
+                    f.seek(pos)
+                    tail = f.read(step) + tail
+                    block_size *= 2
+                    
+                    if pos == data_start:
+                        # Reached the first entry; the tail is the whole log
+                        rows = _parse_audit_rows(tail)
+                        break
                     
-            # Sort by timestamp (newest first) and limit
-            actions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            return actions[:limit]
+                    record_start = _first_record_start(tail)
+                    if record_start != -1:
+                        rows = _parse_audit_rows(tail[record_start:])
+                        if len(rows) >= limit:
+                            break
+            
+            # Newest first
+            return [dict(zip(header, row)) for row in reversed(rows[-limit:])]
             
         except Exception as e:
             print(f"Error reading audit log: {e}")
@@ -3,6 +3,7 @@
 import sys
 import time
 import threading
+from itertools import cycle
 from typing import Callable, Optional, Any
 
 
@@ -29,6 +30,8 @@ class ProgressIndicator:
         _start_time: Time when the progress started
         _running: Whether the progress indicator is running
         _thread: Thread for async progress display
+        _stop_event: Event that wakes the display thread to stop it
+        _bar_cache: Bar strings indexed by filled width
     """
 
     # Spinner character sets
@@ -78,9 +81,13 @@ class ProgressIndicator:
         self._start_time = 0
         self._running = False
         self._thread = None
+        self._stop_event = threading.Event()
         self._last_update = 0
-        self._spinner_idx = 0
+        self._last_drawn = -1
+        self._last_drawn_description = None
+        self._spinner_iter = cycle(self.spinner_chars)
         self._last_line_length = 0
+        self._build_bar_cache()
         
         # Check if the output is a terminal
         self._is_terminal = sys.stdout.isatty()
@@ -88,6 +95,13 @@ class ProgressIndicator:
         # Determine if colors are supported
         self._use_colors = self._is_terminal
     
+    def _build_bar_cache(self) -> None:
+        """Precompute the bar string for every possible filled width."""
+        self._bar_cache = [
+            self.completed_char * filled + self.remaining_char * (self.width - filled)
+            for filled in range(self.width + 1)
+        ]
+    
     def _format_time(self, seconds: float) -> str:
         """
         Format seconds into a human-readable time string.
@@ -101,34 +115,38 @@ class ProgressIndicator:
         if seconds < 60:
             return f"{seconds:.1f}s"
         elif seconds < 3600:
-            minutes = seconds // 60
-            seconds = seconds % 60
-            return f"{int(minutes)}m {int(seconds)}s"
+            minutes, seconds = divmod(int(seconds), 60)
+            return f"{minutes}m {seconds}s"
         else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{int(hours)}h {int(minutes)}m"
+            hours, remainder = divmod(int(seconds), 3600)
+            return f"{hours}h {remainder // 60}m"
     
-    def _calculate_eta(self) -> str:
+    def _calculate_eta(self, now: float) -> str:
         """
         Calculate the estimated time remaining.
         
+        Args:
+            now: Current time.monotonic() reading
+            
         Returns:
             ETA string
         """
         if self._current == 0:
             return "calculating..."
         
-        elapsed = time.time() - self._start_time
+        elapsed = now - self._start_time
         rate = self._current / elapsed if elapsed > 0 else 0
         remaining = (self.total - self._current) / rate if rate > 0 else 0
         
         return self._format_time(remaining)
     
-    def _format_bar(self) -> str:
+    def _format_bar(self, now: float) -> str:
         """
         Format a progress bar.
         
+        Args:
+            now: Current time.monotonic() reading
+            
         Returns:
             Formatted progress bar string
         """
@@ -136,12 +154,12 @@ class ProgressIndicator:
         filled_width = int(self.width * self._current / self.total)
         
         # Create the progress bar
-        bar = self.completed_char * filled_width + self.remaining_char * (self.width - filled_width)
+        bar = self._bar_cache[filled_width]
         
         # Calculate speed and ETA
-        elapsed = time.time() - self._start_time
+        elapsed = now - self._start_time
         speed = self._current / elapsed if elapsed > 0 else 0
-        eta = self._calculate_eta()
+        eta = self._calculate_eta(now)
         
         # Format progress line
         return f"{self.description}: |{bar}| {percent}% ({self._current}/{self.total}) {speed:.1f} it/s ETA: {eta}"
@@ -153,9 +171,8 @@ class ProgressIndicator:
         Returns:
             Formatted spinner string
         """
-        # Update spinner index
-        self._spinner_idx = (self._spinner_idx + 1) % len(self.spinner_chars)
-        spinner = self.spinner_chars[self._spinner_idx]
+        # Advance to the next spinner frame
+        spinner = next(self._spinner_iter)
         
         # Calculate progress if possible
         if self.total > 0:
@@ -185,8 +202,18 @@ class ProgressIndicator:
     
     def _update_display(self) -> None:
         """Update the progress display."""
+        # Nothing to redraw if neither progress nor description has changed
+        # since the last draw; the spinner animates, so it always redraws
+        if (
+            self.style != 'spinner'
+            and self._current == self._last_drawn
+            and self.description == self._last_drawn_description
+            and self._current < self.total
+        ):
+            return
+        
         # Throttle updates to avoid excessive screen refreshes
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_update < 0.1 and self._current < self.total:
             return
         
@@ -194,7 +221,7 @@ class ProgressIndicator:
         
         # Format the progress line based on style
         if self.style == 'bar':
-            line = self._format_bar()
+            line = self._format_bar(current_time)
         elif self.style == 'spinner':
             line = self._format_spinner()
         elif self.style == 'percent':
@@ -202,7 +229,7 @@ class ProgressIndicator:
         elif self.style == 'simple':
             line = self._format_simple()
         else:
-            line = self._format_bar()  # Default to bar
+            line = self._format_bar(current_time)  # Default to bar
         
         # Clear previous line if in a terminal
         if self._is_terminal:
@@ -216,20 +243,28 @@ class ProgressIndicator:
                 print(line)
         
         self._last_line_length = len(line)
+        self._last_drawn = self._current
+        self._last_drawn_description = self.description
     
     def start(self) -> None:
         """Start the progress indicator."""
         self._current = 0
-        self._start_time = time.time()
+        self._last_drawn = -1
+        self._last_drawn_description = None
+        self._start_time = time.monotonic()
         self._running = True
+        self._build_bar_cache()
         self._update_display()
         
         # Start async display thread if using spinner
         if self.style == 'spinner':
+            self._stop_event.clear()
+            
             def _spin():
-                while self._running:
+                # Redraw every 0.1s until finish() sets the event, which
+                # wakes the wait immediately instead of after a full sleep
+                while not self._stop_event.wait(0.1):
                     self._update_display()
-                    time.sleep(0.1)
             
             self._thread = threading.Thread(target=_spin)
             self._thread.daemon = True
@@ -257,16 +292,17 @@ class ProgressIndicator:
         self._current = self.total
         self._running = False
         
+        # Stop the display thread first so it can't redraw after the final line
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+        
         # Final update
         self._update_display()
         
         # Add a newline if in terminal
         if self._is_terminal:
             print()
-        
-        # Wait for thread to finish if exists
-        if self._thread and self._thread.is_alive():
-            self._thread.join(0.2)
     
     def __enter__(self) -> 'ProgressIndicator':
         """Context manager entry."""
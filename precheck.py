@@ -9,12 +9,26 @@ to run the Legal Drive Labels Manager tool.
 import os
 import sys
 import importlib
+import importlib.util
 import platform
+import re
 import subprocess
 import traceback
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any, Union
 
+# importlib.metadata is only available on Python 3.8+
+try:
+    from importlib.metadata import version as _distribution_version, PackageNotFoundError
+except ImportError:
+    _distribution_version = None
+
+# Leading digits of a dotted version component (e.g. "1" in "1rc2")
+_LEADING_DIGITS = re.compile(r"\d+")
+
+# OAuth client files are well under 2 KiB; only this much is inspected
+_CREDENTIALS_READ_LIMIT = 8 * 1024
+
 
 # Define required components
 REQUIRED_PACKAGES = [
@@ -25,19 +39,35 @@ REQUIRED_PACKAGES = [
 
 OPTIONAL_PACKAGES = [
     ("pandas", "1.0.0"),
-    ("matplotlib", "3.0.0"),
+    ("matplotlib", "3.4.0"),
     ("seaborn", "0.11.0"),
 ]
 
+_SYSTEM = platform.system()
+
+# Config directory path based on platform
+if _SYSTEM == "Windows":
+    _CONFIG_DIR = Path(os.environ.get("APPDATA", "")) / "drive_labels"
+elif _SYSTEM == "Darwin":  # macOS
+    _CONFIG_DIR = Path.home() / "Library" / "Application Support" / "drive_labels"
+else:  # Linux/Unix
+    _CONFIG_DIR = Path.home() / ".config" / "drive_labels"
+
 # Define potential credential paths based on platform
 CREDENTIAL_PATHS = [
     Path("credentials.json"),
     Path.home() / ".config" / "drive_labels" / "credentials.json",
 ]
-if platform.system() == "Windows":
-    CREDENTIAL_PATHS.append(Path(os.environ.get("APPDATA", "")) / "drive_labels" / "credentials.json")
-elif platform.system() == "Darwin":  # macOS
-    CREDENTIAL_PATHS.append(Path.home() / "Library" / "Application Support" / "drive_labels" / "credentials.json")
+# Skip the Windows path when APPDATA is unset, since it would resolve relative
+# to the working directory
+if _SYSTEM == "Darwin" or (_SYSTEM == "Windows" and os.environ.get("APPDATA")):
+    CREDENTIAL_PATHS.append(_CONFIG_DIR / "credentials.json")
+
+# The app honours XDG_CONFIG_HOME on Linux/Unix; only probe it when it's set
+_XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME", ""))
+if (_SYSTEM not in ("Windows", "Darwin") and _XDG_CONFIG_HOME.is_absolute()
+        and _XDG_CONFIG_HOME != Path.home() / ".config"):
+    CREDENTIAL_PATHS.append(_XDG_CONFIG_HOME / "drive_labels" / "credentials.json")
 
 
 def check_python_version() -> Tuple[bool, str]:
@@ -70,15 +100,7 @@ def check_packages(packages: List[Tuple[str, str]]) -> List[Tuple[bool, str]]:
     
     for package_name, min_version in packages:
         try:
-            # Try to import the package - will fail if not installed
-            pkg = importlib.import_module(package_name)
-            
-            # Get version (different packages store it differently)
-            version = "unknown"
-            for attr in ["__version__", "version", "VERSION"]:
-                if hasattr(pkg, attr):
-                    version = getattr(pkg, attr)
-                    break
+            version = _installed_version(package_name)
             
             # Check if version is sufficient
             try:
@@ -101,6 +123,39 @@ def check_packages(packages: List[Tuple[str, str]]) -> List[Tuple[bool, str]]:
     return results
 
 
+def _installed_version(package_name: str) -> Any:
+    """
+    Get the installed version of a package.
+    
+    Reads the distribution metadata when possible so the package itself
+    doesn't have to be imported, and falls back to importing it.
+    
+    Args:
+        package_name: Distribution or module name of the package
+        
+    Returns:
+        Version of the package, or "unknown" if it can't be determined
+        
+    Raises:
+        ImportError: If the package is not installed
+    """
+    if _distribution_version is not None:
+        try:
+            return _distribution_version(package_name)
+        except PackageNotFoundError:
+            pass
+    
+    # Try to import the package - will fail if not installed
+    pkg = importlib.import_module(package_name)
+    
+    # Get version (different packages store it differently)
+    for attr in ["__version__", "version", "VERSION"]:
+        version = getattr(pkg, attr, None)
+        if version is not None:
+            return version
+    return "unknown"
+
+
 def parse_version(version_str: Union[str, Tuple, List, Any]) -> Tuple[int, ...]:
     """
     Parse version string into comparable tuple.
@@ -122,17 +177,8 @@ def parse_version(version_str: Union[str, Tuple, List, Any]) -> Tuple[int, ...]:
     parts = []
     for part in version_str.split('.'):
         # Extract leading digits
-        digits = ''
-        for char in part:
-            if char.isdigit():
-                digits += char
-            else:
-                break
-        
-        if digits:
-            parts.append(int(digits))
-        else:
-            parts.append(0)
+        match = _LEADING_DIGITS.match(part)
+        parts.append(int(match.group()) if match else 0)
     
     if not parts:
         return (0,)
@@ -148,17 +194,18 @@ def check_credentials() -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     for path in CREDENTIAL_PATHS:
-        if path.exists():
-            try:
-                # Verify it's a valid credentials file (basic check)
-                with open(path, 'r') as f:
-                    content = f.read()
-                    if '"client_id"' in content and '"client_secret"' in content:
-                        return True, f"Credentials found at: {path}"
-                    else:
-                        return False, f"Found credentials file at {path} but it may be invalid (missing client_id or client_secret)"
-            except Exception as e:
-                return False, f"Found credentials file at {path} but couldn't read it: {str(e)}"
+        try:
+            # Verify it's a valid credentials file (basic check)
+            with open(path, 'rb') as f:
+                content = f.read(_CREDENTIALS_READ_LIMIT)
+                if b'"client_id"' in content and b'"client_secret"' in content:
+                    return True, f"Credentials found at: {path}"
+                else:
+                    return False, f"Found credentials file at {path} but it may be invalid (missing client_id or client_secret)"
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except Exception as e:
+            return False, f"Found credentials file at {path} but couldn't read it: {str(e)}"
     
     # No credentials found
     return False, "Google API credentials not found. Please download OAuth credentials (credentials.json)"
@@ -171,13 +218,7 @@ def check_config_dir() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    # Determine config directory path based on platform
-    if platform.system() == "Windows":
-        config_dir = Path(os.environ.get("APPDATA", "")) / "drive_labels"
-    elif platform.system() == "Darwin":  # macOS
-        config_dir = Path.home() / "Library" / "Application Support" / "drive_labels"
-    else:  # Linux/Unix
-        config_dir = Path.home() / ".config" / "drive_labels"
+    config_dir = _CONFIG_DIR
     
     # Check if it exists
     if config_dir.exists():
@@ -261,6 +302,24 @@ def run_all_checks() -> Dict[str, Dict[str, Any]]:
     # Check Python version
     results["python_version"]["result"], results["python_version"]["message"] = check_python_version()
     
+    # Nothing else can work on an unsupported interpreter, so skip the
+    # remaining (slower) checks
+    if not results["python_version"]["result"]:
+        skipped = "Not checked (Python version below minimum requirement)"
+        for check in ("required_packages", "optional_packages"):
+            packages = REQUIRED_PACKAGES if check == "required_packages" else OPTIONAL_PACKAGES
+            results[check]["result"] = False
+            results[check]["details"] = [
+                (False, f"{package_name} not checked (✗ required: {min_version})")
+                for package_name, min_version in packages
+            ]
+        for check in ("credentials", "config_dir", "install_status", "auth_module"):
+            results[check]["result"] = False
+            results[check]["message"] = skipped
+        results["overall"]["result"] = False
+        results["overall"]["message"] = "Environment setup has issues that need to be addressed."
+        return results
+    
     # Check required packages
     pkg_results = check_packages(REQUIRED_PACKAGES)
     results["required_packages"]["details"] = pkg_results
@@ -280,12 +339,16 @@ def run_all_checks() -> Dict[str, Dict[str, Any]]:
     # Check installation status
     results["install_status"]["result"], results["install_status"]["message"] = check_install_status()
     
-    # Check auth module if installed
-    if results["install_status"]["result"]:
-        results["auth_module"]["result"], results["auth_module"]["message"] = check_authentication_test()
-    else:
+    # Check auth module if installed; importing it pulls in the Google API
+    # client stack, so skip it when the required packages are missing
+    if not results["install_status"]["result"]:
         results["auth_module"]["result"] = False
         results["auth_module"]["message"] = "Cannot test authentication module (package not installed)"
+    elif not results["required_packages"]["result"]:
+        results["auth_module"]["result"] = False
+        results["auth_module"]["message"] = "Cannot test authentication module (required packages missing)"
+    else:
+        results["auth_module"]["result"], results["auth_module"]["message"] = check_authentication_test()
     
     # Determine overall status
     critical_checks = ["python_version", "required_packages", "config_dir"]
@@ -309,18 +372,22 @@ def fix_common_issues(results: Dict[str, Dict[str, Any]]) -> None:
     """
     if not results["required_packages"]["result"]:
         print("\nAttempting to install missing required packages...")
-        for passed, message in results["required_packages"]["details"]:
-            if not passed:
-                package_name = message.split()[0]
-                min_version = message.split("required: ")[1].rstrip(")")
-                try:
-                    subprocess.check_call([
-                        sys.executable, "-m", "pip", "install", 
-                        f"{package_name}>={min_version}"
-                    ])
-                    print(f"Installed {package_name}")
-                except subprocess.CalledProcessError:
-                    print(f"Failed to install {package_name}")
+        missing = [
+            f"{pkg_name}>={min_version}"
+            for (passed, _), (pkg_name, min_version) in zip(
+                results["required_packages"]["details"], REQUIRED_PACKAGES
+            )
+            if not passed
+        ]
+        # Install them all with a single pip run
+        try:
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input", *missing
+            ])
+            print(f"Installed {', '.join(missing)}")
+        except subprocess.CalledProcessError:
+            print(f"Failed to install {', '.join(missing)}")
     
     if not results["optional_packages"]["result"] and results["overall"]["result"]:
         print("\nWould you like to install optional packages for visualization? (y/n)")
@@ -330,7 +397,7 @@ def fix_common_issues(results: Dict[str, Dict[str, Any]]) -> None:
             try:
                 subprocess.check_call([
                     sys.executable, "-m", "pip", "install",
-                    "pandas>=1.0.0", "matplotlib>=3.0.0", "seaborn>=0.11.0"
+                    "pandas>=1.0.0", "matplotlib>=3.4.0", "seaborn>=0.11.0"
                 ])
                 print("Optional packages installed successfully")
             except subprocess.CalledProcessError:
@@ -340,19 +407,25 @@ def fix_common_issues(results: Dict[str, Dict[str, Any]]) -> None:
     if not results["config_dir"]["result"]:
         print("\nAttempting to create config directory...")
         try:
-            if platform.system() == "Windows":
-                config_dir = Path(os.environ.get("APPDATA", "")) / "drive_labels"
-            elif platform.system() == "Darwin":  # macOS
-                config_dir = Path.home() / "Library" / "Application Support" / "drive_labels"
-            else:  # Linux/Unix
-                config_dir = Path.home() / ".config" / "drive_labels"
-                
-            config_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Created config directory: {config_dir}")
+            _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            print(f"Created config directory: {_CONFIG_DIR}")
         except Exception as e:
             print(f"Failed to create config directory: {e}")
 
 
+def _status_mark(passed: Any) -> str:
+    """
+    Get the status mark for a check result.
+    
+    Args:
+        passed: Result of the check
+        
+    Returns:
+        "✓" if the check passed, "✗" otherwise
+    """
+    return "✓" if passed else "✗"
+
+
 def print_results(results: Dict[str, Dict[str, Any]]) -> None:
     """
     Print check results in a readable format.
@@ -370,37 +443,44 @@ def print_results(results: Dict[str, Dict[str, Any]]) -> None:
     # Required packages
     print("\nRequired Packages:")
     for passed, message in results["required_packages"]["details"]:
-        status = "✓" if passed else "✗"
+        status = _status_mark(passed)
         print(f"  [{status}] {message}")
     
     # Optional packages
     print("\nOptional Packages (for visualization):")
     for passed, message in results["optional_packages"]["details"]:
-        status = "✓" if passed else "✗"
+        status = _status_mark(passed)
         print(f"  [{status}] {message}")
     
     # Credentials
-    cred_status = "✓" if results["credentials"]["result"] else "✗"
+    cred_status = _status_mark(results["credentials"]["result"])
     print(f"\nCredentials: [{cred_status}] {results['credentials']['message']}")
     
     # Config directory
-    config_status = "✓" if results["config_dir"]["result"] else "✗"
+    config_status = _status_mark(results["config_dir"]["result"])
     print(f"Config Directory: [{config_status}] {results['config_dir']['message']}")
     
     # Installation status
-    install_status = "✓" if results["install_status"]["result"] else "✗"
+    install_status = _status_mark(results["install_status"]["result"])
     print(f"Installation: [{install_status}] {results['install_status']['message']}")
     
     # Auth module check
-    auth_status = "✓" if results["auth_module"]["result"] else "✗"
+    auth_status = _status_mark(results["auth_module"]["result"])
     print(f"Auth Module: [{auth_status}] {results['auth_module']['message']}")
     
     # Overall status
     print("\n" + "-" * 80)
-    overall_status = "✓" if results["overall"]["result"] else "✗"
+    overall_status = _status_mark(results["overall"]["result"])
     print(f"Overall Status: [{overall_status}] {results['overall']['message']}")
     print("-" * 80 + "\n")
     
+    # The remaining checks were skipped, so upgrading is the only advice
+    if not results["python_version"]["result"]:
+        print("Recommendations:")
+        print("- Upgrade Python to version 3.7 or higher")
+        print()
+        return
+    
     # Recommendations if issues exist
     if not results["overall"]["result"]:
         print("Recommendations:")
@@ -448,9 +528,11 @@ def check_test_environment() -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
+        # Locate the modules without executing them
         test_imports = ["unittest", "unittest.mock"]
         for module in test_imports:
-            importlib.import_module(module)
+            if importlib.util.find_spec(module) is None:
+                return False, f"Missing required testing module: {module}"
             
         # Check if test directory exists
         if Path("tests").is_dir():
@@ -477,27 +559,13 @@ def run_tests() -> Tuple[bool, str]:
     """
     try:
         import unittest
-        import io
-        import sys
         
-        # Capture stdout to display test results
-        original_stdout = sys.stdout
-        test_output = io.StringIO()
-        sys.stdout = test_output
-        
-        # Run tests in discovery mode
+        # Run tests in discovery mode, streaming results straight to stdout
         loader = unittest.TestLoader()
         suite = loader.discover("tests")
-        runner = unittest.TextTestRunner(verbosity=2)
+        runner = unittest.TextTestRunner(stream=sys.stdout, verbosity=2)
         result = runner.run(suite)
         
-        # Restore stdout and get the captured output
-        sys.stdout = original_stdout
-        output = test_output.getvalue()
-        
-        # Print the test output
-        print(output)
-        
         # Check results
         if result.failures or result.errors:
             return False, f"Tests failed: {len(result.failures)} failures, {len(result.errors)} errors"
@@ -540,8 +608,10 @@ def main():
         # Print results
         print_results(results)
         
-        # Try to fix issues if needed
-        if not results["overall"]["result"] or not results["optional_packages"]["result"]:
+        # Try to fix issues if needed (nothing can be fixed on an unsupported Python)
+        if results["python_version"]["result"] and (
+            not results["overall"]["result"] or not results["optional_packages"]["result"]
+        ):
             print("Would you like to try to fix the issues automatically? (y/n)")
             response = input().lower()
             if response.startswith('y'):
@@ -558,14 +628,14 @@ def main():
             response = input().lower()
             if response.startswith('y'):
                 test_env_success, test_env_message = check_test_environment()
-                print(f"\nTest Environment: {'✓' if test_env_success else '✗'} {test_env_message}")
+                print(f"\nTest Environment: {_status_mark(test_env_success)} {test_env_message}")
                 
                 if test_env_success:
                     print("\nWould you like to run the tests? (y/n)")
                     response = input().lower()
                     if response.startswith('y'):
                         test_success, test_message = run_tests()
-                        print(f"\nTest Results: {'✓' if test_success else '✗'} {test_message}")
+                        print(f"\nTest Results: {_status_mark(test_success)} {test_message}")
                 else:
                     print("\nWould you like to set up the development environment? (y/n)")
                     response = input().lower()
@@ -1,5 +1,6 @@
 """Tests for file label management functionality."""
 
+import inspect
 import unittest
 import tempfile
 from unittest.mock import patch, MagicMock, PropertyMock
@@ -8,6 +9,7 @@ from pathlib import Path
 from legal_drive_labels_manager.files.manager import FileManager
 from legal_drive_labels_manager.files.operations import (
     extract_file_id_from_url, 
+    iter_csv_for_bulk_operations,
     parse_csv_for_bulk_operations
 )
 
@@ -303,123 +305,206 @@ class TestFileManager(unittest.TestCase):
             }
         ]
         
-        # Mock apply_label method
-        self.file_manager.apply_label = MagicMock(return_value={
-            'success': True
-        })
+        # Mock label_manager.get_label for field type lookup
+        self.mock_label_manager.get_label.return_value = {
+            'id': 'label1',
+            'fields': [{'id': 'status', 'type': 'SELECTION'}]
+        }
+        
+        # Mock the batch HTTP request to answer every queued request
+        mock_batch = MagicMock()
+        
+        def new_batch_http_request(callback):
+            mock_batch.execute.side_effect = lambda: [
+                callback(call[1]['request_id'], {}, None)
+                for call in mock_batch.add.call_args_list
+            ]
+            return mock_batch
+        
+        self.mock_drive_service.new_batch_http_request.side_effect = new_batch_http_request
         
-        # Mock progress callback
-        mock_callback = MagicMock()
+        # Record progress callback calls
+        progress_calls = []
         
         # Call bulk_apply_labels
-        results = self.file_manager.bulk_apply_labels(entries, mock_callback)
+        results = self.file_manager.bulk_apply_labels(
+            entries, lambda *args: progress_calls.append(args)
+        )
         
         # Verify results
         self.assertEqual(results['total'], 2)
         self.assertEqual(results['successful'], 2)
         self.assertEqual(results['failed'], 0)
         
-        # Verify apply_label calls
-        self.assertEqual(self.file_manager.apply_label.call_count, 2)
+        # Verify both updates went out in a single batch request
+        self.assertEqual(mock_batch.add.call_count, 2)
+        mock_batch.execute.assert_called_once()
+        self.mock_label_manager.get_label.assert_called_once_with('label1')
+        
+        # Verify the queued label modification
+        body = self.mock_drive_service.files.return_value.modifyLabels.call_args_list[0][1]['body']
+        self.assertEqual(
+            body['labelModifications'][0]['fieldModifications'],
+            [{'fieldId': 'status', 'setSelectionValues': [{'valueId': 'Approved'}]}]
+        )
         
         # Verify callback calls
-        self.assertEqual(mock_callback.call_count, 2)
-        mock_callback.assert_any_call(0, 2)  # First call
-        mock_callback.assert_any_call(2, 2)  # Final call
+        self.assertIn((0, 2, 'Processing batch 1/1'), progress_calls)
+        self.assertEqual(progress_calls[-1], (2, 2, 'Complete'))
         
         # Verify logging
         self.mock_logger.log_action.assert_called_once()
 
+    @patch('legal_drive_labels_manager.files.manager.time.sleep')
+    def test_batch_update_files_removes_after_applies(self, mock_sleep):
+        """Test that label removals are sent in batches after every apply."""
+        operations = [
+            {'operation': 'apply', 'file_id': 'file1', 'label_id': 'label1',
+             'field_id': 'status', 'value': 'Approved'},
+            {'operation': 'remove', 'file_id': 'file1', 'label_id': 'label1'},
+            {'operation': 'apply', 'file_id': 'file2', 'label_id': 'label1',
+             'field_id': 'status', 'value': 'Pending'}
+        ]
+        
+        self.mock_label_manager.get_label.return_value = {
+            'id': 'label1',
+            'fields': [{'id': 'status', 'type': 'TEXT'}]
+        }
+        
+        # Stand in each request for the file and modification it carries
+        self.mock_drive_service.files.return_value.modifyLabels.side_effect = (
+            lambda fileId, body: (fileId, body['labelModifications'][0])
+        )
+        
+        # Record the requests sent in each batch and answer them all
+        batches = []
+        
+        def new_batch_http_request(callback):
+            requests = []
+            batches.append(requests)
+            mock_batch = MagicMock()
+            mock_batch.add.side_effect = lambda request, request_id: requests.append(
+                (request, request_id)
+            )
+            mock_batch.execute.side_effect = lambda: [
+                callback(request_id, {}, None) for _, request_id in requests
+            ]
+            return mock_batch
+        
+        self.mock_drive_service.new_batch_http_request.side_effect = new_batch_http_request
+        
+        results = self.file_manager.batch_update_files(operations, batch_size=100)
+        
+        self.assertEqual(results['successful'], 3)
+        self.assertEqual(results['failed'], 0)
+        
+        # Both applies share the first batch; the removal follows on its own
+        self.assertEqual(
+            [[(file_id, 'removeLabel' in mod) for (file_id, mod), _ in batch] for batch in batches],
+            [[('file1', False), ('file2', False)], [('file1', True)]]
+        )
+        mock_sleep.assert_called_once_with(1.0)
+
 
 class TestFileOperations(unittest.TestCase):
     """Test cases for file operation utilities."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Write the CSV files shared by the parsing tests."""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        temp_dir = Path(cls._temp_dir.name)
+        
+        cls.csv_path = temp_dir / 'bulk.csv'
+        cls.csv_path.write_text(
+            "fileId,labelId,fieldId,value\n"
+            "file1,label1,status,Approved\n"
+            "file2,label1,status,Pending\n"
+            # Row with missing value
+            "file3,label1,status,\n"
+        )
+        
+        # CSV with missing required columns (no labelId or fieldId)
+        cls.invalid_csv_path = temp_dir / 'invalid.csv'
+        cls.invalid_csv_path.write_text(
+            "fileId,status,value\n"
+            "file1,Approved,Yes\n"
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared CSV files."""
+        cls._temp_dir.cleanup()
+
     def test_extract_file_id_from_url(self):
         """Test extracting file IDs from various URL formats."""
-        # Test direct ID
-        self.assertEqual(extract_file_id_from_url('abc123'), 'abc123')
+        cases = [
+            # Direct ID
+            ('abc123', 'abc123'),
+            # Drive URLs
+            ('https://drive.google.com/file/d/abc123/view', 'abc123'),
+            ('https://docs.google.com/document/d/abc123/edit', 'abc123'),
+            ('https://docs.google.com/spreadsheets/d/abc123/edit', 'abc123'),
+            ('https://docs.google.com/presentation/d/abc123/edit', 'abc123'),
+            # URL with id parameter
+            ('https://drive.google.com/open?id=abc123', 'abc123'),
+            # Invalid URL
+            ('https://example.com/not-a-drive-url', None),
+        ]
         
-        # Test Drive URLs
-        self.assertEqual(
-            extract_file_id_from_url('https://drive.google.com/file/d/abc123/view'),
-            'abc123'
-        )
-        self.assertEqual(
-            extract_file_id_from_url('https://docs.google.com/document/d/abc123/edit'),
-            'abc123'
-        )
-        self.assertEqual(
-            extract_file_id_from_url('https://docs.google.com/spreadsheets/d/abc123/edit'),
-            'abc123'
-        )
-        self.assertEqual(
-            extract_file_id_from_url('https://docs.google.com/presentation/d/abc123/edit'),
-            'abc123'
-        )
+        for url, expected in cases:
+            with self.subTest(url=url):
+                self.assertEqual(extract_file_id_from_url(url), expected)
+
+    def test_parse_csv_valid_rows(self):
+        """Test parsing a CSV with complete rows."""
+        rows, errors = parse_csv_for_bulk_operations(str(self.csv_path))
+        
+        # Verify parsed rows
+        self.assertEqual(len(rows), 2)  # Should only include complete rows
+        self.assertEqual(rows[0]['fileId'], 'file1')
+        self.assertEqual(rows[0]['value'], 'Approved')
+
+    def test_parse_csv_reports_missing_value(self):
+        """Test that incomplete rows are reported as errors."""
+        rows, errors = parse_csv_for_bulk_operations(str(self.csv_path))
         
-        # Test URL with id parameter
-        self.assertEqual(
-            extract_file_id_from_url('https://drive.google.com/open?id=abc123'),
-            'abc123'
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Row 4: Missing values for: value', errors[0])
+
+    def test_parse_csv_custom_required_columns(self):
+        """Test parsing with custom required columns."""
+        rows, errors = parse_csv_for_bulk_operations(
+            str(self.csv_path),
+            required_columns=['fileId', 'labelId']
         )
+        self.assertEqual(len(rows), 3)  # Should include all rows now
+
+    def test_parse_csv_nonexistent_file(self):
+        """Test parsing a CSV file that doesn't exist."""
+        rows, errors = parse_csv_for_bulk_operations('nonexistent.csv')
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('CSV file not found', errors[0])
+
+    def test_iter_csv_for_bulk_operations(self):
+        """Test streaming CSV rows and errors in file order."""
+        items = iter_csv_for_bulk_operations(str(self.csv_path))
+        self.assertTrue(inspect.isgenerator(items))
         
-        # Test invalid URL
-        self.assertIsNone(extract_file_id_from_url('https://example.com/not-a-drive-url'))
+        # Rows are produced one at a time
+        kind, row = next(items)
+        self.assertEqual(kind, 'row')
+        self.assertEqual(row['fileId'], 'file1')
+        
+        self.assertEqual([kind for kind, _ in items], ['row', 'error'])
 
-    def test_parse_csv_for_bulk_operations(self):
-        """Test parsing CSV files for bulk operations."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
-            temp_file.write("fileId,labelId,fieldId,value\n")
-            temp_file.write("file1,label1,status,Approved\n")
-            temp_file.write("file2,label1,status,Pending\n")
-            # Row with missing value
-            temp_file.write("file3,label1,status,\n")
-            temp_path = temp_file.name
-        
-        try:
-            # Test with valid CSV
-            rows, errors = parse_csv_for_bulk_operations(temp_path)
-            
-            # Verify parsed rows
-            self.assertEqual(len(rows), 2)  # Should only include complete rows
-            self.assertEqual(rows[0]['fileId'], 'file1')
-            self.assertEqual(rows[0]['value'], 'Approved')
-            
-            # Verify error for incomplete row
-            self.assertEqual(len(errors), 1)
-            self.assertIn('Row 4: Missing values for: value', errors[0])
-            
-            # Test with non-existent file
-            rows, errors = parse_csv_for_bulk_operations('nonexistent.csv')
-            self.assertEqual(len(rows), 0)
-            self.assertEqual(len(errors), 1)
-            self.assertIn('CSV file not found', errors[0])
-            
-            # Test with custom required columns
-            rows, errors = parse_csv_for_bulk_operations(
-                temp_path,
-                required_columns=['fileId', 'labelId']
-            )
-            self.assertEqual(len(rows), 3)  # Should include all rows now
-            
-            # Create a CSV with missing required columns
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as invalid_file:
-                invalid_file.write("fileId,status,value\n")  # Missing labelId
-                invalid_file.write("file1,Approved,Yes\n")
-                invalid_path = invalid_file.name
-            
-            rows, errors = parse_csv_for_bulk_operations(invalid_path)
-            self.assertEqual(len(rows), 0)
-            self.assertEqual(len(errors), 1)
-            self.assertIn('CSV is missing required columns: labelId, fieldId', errors[0])
-            
-            # Clean up invalid file
-            Path(invalid_path).unlink()
-            
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink()
+    def test_parse_csv_missing_required_columns(self):
+        """Test parsing a CSV that lacks required columns."""
+        rows, errors = parse_csv_for_bulk_operations(str(self.invalid_csv_path))
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('CSV is missing required columns: labelId, fieldId', errors[0])
 
 
 if __name__ == '__main__':
@@ -404,8 +404,9 @@ class TestFieldTypes(unittest.TestCase):
         self.assertEqual(FieldType.USER.value, "USER")
         
         # Test from_string method
-        self.assertEqual(FieldType.from_string("TEXT"), FieldType.TEXT)
-        self.assertEqual(FieldType.from_string("SELECTION"), FieldType.SELECTION)
+        for field_type in FieldType:
+            with self.subTest(field_type=field_type):
+                self.assertEqual(FieldType.from_string(field_type.value), field_type)
         
         # Test invalid type
         with self.assertRaises(ValueError):
@@ -428,6 +429,25 @@ class TestFieldTypes(unittest.TestCase):
         # Test invalid INTEGER formatting
         with self.assertRaises(ValueError):
             FieldValue.format_value(FieldType.INTEGER, "not an integer")
+        
+        # Test every field type, by enum and by string name
+        expected = {
+            FieldType.TEXT: ("Test Value", {"textValue": "Test Value"}),
+            FieldType.LONG_TEXT: ("Long Value", {"textValue": "Long Value"}),
+            FieldType.INTEGER: ("7", {"integerValue": 7}),
+            FieldType.DATE: ("2023-01-01", {"dateValue": "2023-01-01"}),
+            FieldType.USER: ("user@example.com", {"userValue": "user@example.com"}),
+            FieldType.SELECTION: ("opt1", {"selectionValue": {"valueId": "opt1"}}),
+        }
+        for field_type in FieldType:
+            value, formatted = expected[field_type]
+            with self.subTest(field_type=field_type):
+                self.assertEqual(FieldValue.format_value(field_type, value), formatted)
+                self.assertEqual(FieldValue.format_value(field_type.value, value), formatted)
+        
+        # Test unsupported field type
+        with self.assertRaises(ValueError):
+            FieldValue.format_value("INVALID_TYPE", "value")
 
 
 if __name__ == '__main__':
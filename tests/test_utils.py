@@ -0,0 +1,103 @@
+"""Tests for utility functionality."""
+
+import csv
+import io
+import itertools
+import unittest
+import tempfile
+from unittest.mock import patch
+from pathlib import Path
+
+from legal_drive_labels_manager.utils.logging import AuditLogger
+from legal_drive_labels_manager.utils.progress import ProgressCallback, ProgressIndicator
+
+
+class TestAuditLogger(unittest.TestCase):
+    """Test cases for AuditLogger class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        # Create a temporary config directory for the log
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.audit_logger = AuditLogger(config_dir=Path(self.temp_dir.name))
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.audit_logger.close()
+        self.temp_dir.cleanup()
+
+    def test_get_recent_actions_multiline_descriptions(self):
+        """Test reading recent actions whose descriptions span several lines."""
+        # Log enough entries that only the tail of the file is read
+        for i in range(3000):
+            self.audit_logger.log_action(
+                "apply_label",
+                f"file{i}",
+                f"Entry {i}\nsecond line, with \"quotes\"\n\"third line"
+            )
+
+        with open(self.audit_logger.log_file_path, newline="") as f:
+            expected = list(reversed(list(csv.DictReader(f))))
+
+        for limit in (1, 50, 1000, 2500, 3000, 5000):
+            with self.subTest(limit=limit):
+                actions = self.audit_logger.get_recent_actions(limit)
+                self.assertEqual(len(actions), min(limit, 3000))
+                self.assertEqual(actions, expected[:limit])
+
+        # Newest first
+        self.assertEqual(self.audit_logger.get_recent_actions(1)[0]['target_id'], 'file2999')
+
+    def test_close(self):
+        """Test closing the audit log handle."""
+        self.audit_logger.log_action("apply_label", "file1", "Applied label")
+        log_file = self.audit_logger._log_file
+        self.assertFalse(log_file.closed)
+        
+        self.audit_logger.close()
+        self.assertTrue(log_file.closed)
+        
+        # Logging again reopens the file and keeps earlier entries
+        with self.audit_logger as audit_logger:
+            audit_logger.log_action("remove_label", "file1", "Removed label")
+        self.assertIsNone(self.audit_logger._log_file)
+        self.assertEqual(len(self.audit_logger.get_recent_actions()), 2)
+
+    def test_get_recent_actions_no_log(self):
+        """Test reading recent actions before anything was logged."""
+        self.assertEqual(self.audit_logger.get_recent_actions(), [])
+
+
+class TestProgressIndicator(unittest.TestCase):
+    """Test cases for ProgressIndicator class."""
+
+    def test_description_change_redraws(self):
+        """Test that a new message is drawn even when progress hasn't moved."""
+        output = io.StringIO()
+        
+        # Advance the clock a full second per reading so no draw is throttled
+        with patch('sys.stdout', output), patch(
+            'legal_drive_labels_manager.utils.progress.time.monotonic',
+            side_effect=itertools.count(start=1000)
+        ):
+            progress = ProgressIndicator(total=300, style='simple', description='Progress')
+            progress._is_terminal = True
+            progress.start()
+            
+            callback = ProgressCallback(progress)
+            
+            # Same progress calls bulk_apply_labels makes for three batches
+            for batch_number in range(1, 4):
+                done = (batch_number - 1) * 100
+                callback(done, 300, f"Processing batch {batch_number}/3")
+                callback(done + 100, 300)
+        
+        # Each message is drawn alongside the progress it was sent with
+        for batch_number in range(1, 4):
+            done = (batch_number - 1) * 100
+            with self.subTest(batch_number=batch_number):
+                self.assertIn(f"Processing batch {batch_number}/3: {done}/300", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()